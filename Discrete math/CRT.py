@@ -1,4 +1,39 @@
-from functions import _raise_if_not_positive_integer, sieve_of_eratosthenes, _raise_if_not_integer, inverse_modulo
+from functools import lru_cache
+from itertools import compress
+
+from functions import _raise_if_not_positive_integer, sieve_of_eratosthenes, _raise_if_not_integer, inverse_modulo_many
+
+@lru_cache(maxsize=None)
+def _basis() -> tuple:
+    '''
+    Internal function: first 1000 primes from 10^9+7, which are used as modulus
+    They are computed once per process and shared by all instances of CRT
+    '''
+    # bucket sieve of Eratosthenes
+    start = 10**9+7
+    end = start + 10**5
+    sieve = bytearray([1]) * (end-start+1)
+
+    # For factorizing numbers up to 10**10
+    for p in sieve_of_eratosthenes(10**5, True):
+        first = (start+p-1)//p*p
+        sieve[first-start::p] = bytes(len(range(first, end+1, p)))
+
+    return tuple(compress(range(start, end+1), sieve))[:1000]
+
+# _inverses[i][j] is inverse of _basis()[j] by modulus _basis()[i], for j < i
+_inverses = []
+
+def _basis_inverses(num: int) -> list:
+    '''
+    Internal function: table of inverses for Garner's algorithm for first num modulus of basis
+    Table is extended only when bigger num is needed
+    '''
+    basis = _basis()
+    while len(_inverses) < num:
+        i = len(_inverses)
+        _inverses.append(inverse_modulo_many(basis[:i], basis[i]))
+    return _inverses
 
 class CRT:
     def __init__(self, x: int, num=None) -> None:
@@ -14,39 +49,18 @@ class CRT:
             cur = abs(x)
             while cur > 1:
                 num += 1
-                x /= 10**9
+                cur //= 10**9
             num = min(1000, num**2)
 
         _raise_if_not_positive_integer(num)
         if num > 1000:
             raise ValueError("Argument is too big")
 
-        # For factorizing numbers up to 10**10
-        primes = sieve_of_eratosthenes(10**5, True)
-        self.modulus = list()
-
-        # bucket sieve of Eratosthenes
-        start = 10**9+7
-        end = start + 10**5
-        sieve = [True]*(end-start+1)
-
-        for p in primes:
-            for j in range((start+p-1)//p*p, end+1, p):
-                sieve[j-start] = False
-
-        big_primes = []
-        for i in range(start, end+1):
-            if sieve[i-start]:
-                big_primes.append(i)
-
         # set as modulus in CRT first num primes
-        self.modulus = big_primes[:num]
-        print(self.modulus)
+        self.modulus = list(_basis()[:num])
 
         # list of remainders by CRT modulus
-        self.vals = list()
-        for m in self.modulus:
-            self.vals.append(x%m)
+        self.vals = [x%m for m in self.modulus]
 
         
     def mult(self, x: int) -> None:
@@ -80,7 +94,7 @@ class CRT:
         '''
         Return CRT instance as int
         '''
-        return CRT.cheenese_remainder_theorem(self.vals, self.modulus)
+        return CRT._garner(self.vals, self.modulus, _basis_inverses(len(self.modulus)))
 
     def cheenese_remainder_theorem(a: list, m: list) -> int:
         '''
@@ -101,10 +115,15 @@ class CRT:
         for i in a: _raise_if_not_positive_integer(i)
         for i in m: _raise_if_not_positive_integer(i)
 
-        k = len(a)
+        # r[i][j] will be equal to inverse m[j] by modulus m[i], for j < i
+        r = [inverse_modulo_many(m[:i], m[i]) for i in range(len(m))]
+        return CRT._garner(a, m, r)
 
-        # r[i][j] will be equal to inverse m[i] by modulus m[j]
-        r = [[False]*k for _ in range(k)]
+    def _garner(a: list, m: list, r: list) -> int:
+        '''
+        Internal function: Garner's algorithm with precomputed table r of inverses
+        '''
+        k = len(a)
 
         # answer will be in form x[0] + x[1]*m[0] + x[2]*(m[0]*m[1]) + ... x[k-1]*(m[0]*...*m[k-2])
         x = [0]*k
@@ -114,17 +133,13 @@ class CRT:
         mult = 1
 
         ret = 0
-        for i in range(k):
-            for j in range(k):
-                r[i][j] = inverse_modulo(m[i], m[j])
-
         for i in range(k):
             x[i] = a[i]
             for j in range(i):
-                if r[j][i] == False:
+                if r[i][j] is False:
                     return False
 
-                x[i] = r[j][i] * (x[i] - x[j])
+                x[i] = r[i][j] * (x[i] - x[j])
 
                 # if x is negative or more than p[i]
                 # we need to fetch it to interval [0, p[i])
@@ -134,7 +149,7 @@ class CRT:
 
             # add new modulus to mult
             mult *= m[i]
-        if ret >= mult/2:
+        if 2*ret >= mult:
             # this let us use negative numbers
             ret -= mult
         return ret
\ No newline at end of file
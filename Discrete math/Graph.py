@@ -1,3 +1,254 @@
+import mmap
+import os
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is needed only for frontier mode of bfs and Graph.load_edges
+    np = None
+
+# bytes which can appear in edge list file
+_EDGE_LIST_SYMBOLS = b"0123456789 \t\r\n,"
+_INT32_MAX = 2**31 - 1
+
+class CSR:
+    '''
+    Compressed sparse row adjacency: neighbors of vertex v are
+        neighbors[offsets[v]:offsets[v]+degree[v]], in the same order as edges were given
+    Takes 4 bytes per edge instead of dozens for list of lists
+    Vertex has place for capacity[v] neighbors, when it is full, neighbors of vertex
+        are moved to the end of array with doubled capacity, and old place becomes garbage
+    size - number of stored neighbors, garbage - number of places of moved vertices
+    '''
+    def __init__(self, n: int, edges: list, is_undirected=True):
+        # count degrees, offsets[v+1] - offsets[v] is degree of v
+        offsets = array('q', bytes(8*(n+2)))
+        for a, b in edges:
+            offsets[a+1] += 1
+            if is_undirected:
+                offsets[b+1] += 1
+        for v in range(1, n+2):
+            offsets[v] += offsets[v-1]
+
+        # fill neighbors, pos[v] is place for next neighbor of v
+        self.neighbors = array('i', bytes(4*offsets[n+1]))
+        pos = array('q', offsets)
+        for a, b in edges:
+            self.neighbors[pos[a]] = b
+            pos[a] += 1
+            if is_undirected:
+                self.neighbors[pos[b]] = a
+                pos[b] += 1
+        self.__set_offsets(offsets)
+
+    def __set_offsets(self, offsets):
+        # offsets of size n+2 without free places
+        self.degree = array('i', (offsets[v+1] - offsets[v] for v in range(len(offsets)-1)))
+        self.capacity = array('i', self.degree)
+        self.offsets = offsets[:-1]
+        self.size = offsets[-1]
+        self.garbage = 0
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, v: int):
+        return self.neighbors[self.offsets[v]:self.offsets[v]+self.degree[v]]
+
+    def from_arrays(offsets, neighbors):
+        '''
+        Create CSR from ready numpy arrays of offsets (size n+2) and neighbors
+        '''
+        ret = CSR.__new__(CSR)
+        ret.neighbors = array('i', neighbors.astype(np.int32).tobytes())
+        ret.offsets = array('q', offsets[:-1].astype(np.int64).tobytes())
+        ret.degree = array('i', np.diff(offsets).astype(np.int32).tobytes())
+        ret.capacity = array('i', ret.degree)
+        ret.size = len(neighbors)
+        ret.garbage = 0
+        return ret
+
+    def add_vertices(self, k: int) -> None:
+        for _ in range(k):
+            self.offsets.append(len(self.neighbors))
+            self.degree.append(0)
+            self.capacity.append(0)
+
+    def append(self, v: int, u: int) -> None:
+        '''
+        Add u to the end of neighbors of v, amortized O(1)
+        '''
+        start, degree, capacity = self.offsets[v], self.degree[v], self.capacity[v]
+        if degree == capacity:
+            new_capacity = max(2*capacity, 4)
+            if start + capacity == len(self.neighbors):
+                # place of v is at the end of array, so it can grow in place
+                self.neighbors.extend(array('i', bytes(4*(new_capacity - capacity))))
+            else:
+                self.neighbors.extend(self.neighbors[start:start+degree])
+                self.neighbors.extend(array('i', bytes(4*(new_capacity - degree))))
+                self.garbage += capacity
+                self.offsets[v] = start = len(self.neighbors) - new_capacity
+            self.capacity[v] = new_capacity
+        self.neighbors[start+degree] = u
+        self.degree[v] += 1
+        self.size += 1
+
+    def remove(self, v: int, u: int) -> bool:
+        '''
+        Delete first occurrence of u from neighbors of v, order of others is kept
+        Return False if there is no such neighbor
+        '''
+        start, degree = self.offsets[v], self.degree[v]
+        try:
+            i = self.neighbors.index(u, start, start+degree)
+        except ValueError:
+            return False
+        self.neighbors[i:start+degree-1] = self.neighbors[i+1:start+degree]
+        self.degree[v] -= 1
+        self.size -= 1
+        return True
+
+    def compact(self) -> None:
+        '''
+        Move neighbors of all vertices together without free places and garbage
+        '''
+        neighbors = array('i')
+        offsets = array('q')
+        for v in range(len(self.offsets)):
+            offsets.append(len(neighbors))
+            neighbors.extend(self[v])
+        offsets.append(len(neighbors))
+        self.neighbors = neighbors
+        self.__set_offsets(offsets)
+
+    def need_compaction(self) -> bool:
+        # garbage takes more place than all neighbors
+        return self.garbage > self.size
+
+def _read_chunks(path: str, chunk_size: int):
+    '''
+    Yield content of file by chunks of about chunk_size bytes, every chunk ends on line end
+    File is memory-mapped, so only current chunk is read to memory
+    '''
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            # empty file can't be memory-mapped
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < len(data):
+                end = start + chunk_size
+                if end < len(data):
+                    # move end to the nearest line end
+                    end = data.find(b"\n", end) + 1 or len(data)
+                yield data[start:end]
+                start = end
+
+def _parse_edges(chunk: bytes):
+    '''
+    Parse lines "a b" or "a,b" of chunk by vectorized operations
+    Return int32 arrays (a, b) or None if chunk doesn't match the format
+    '''
+    if chunk.translate(None, _EDGE_LIST_SYMBOLS):
+        # unknown symbols
+        return None
+    text = np.frombuffer(chunk, dtype=np.uint8)
+    if not len(text):
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+    is_digit = (text - ord('0')) < 10
+
+    # every line must contain exactly two numbers or be empty
+    # count[i] - number of numbers which start before i-th byte inclusively
+    is_start = is_digit.copy()
+    is_start[1:] &= ~is_digit[:-1]
+    count = np.cumsum(is_start, dtype=np.int32)
+    line_ends = np.concatenate(([0], count[text == ord('\n')], count[-1:]))
+    per_line = np.diff(line_ends)
+    if ((per_line != 0) & (per_line != 2)).any():
+        return None
+
+    # number with more digits than int32 maximum has digits in all positions [i, i+digits]
+    digits = len(str(_INT32_MAX))
+    if len(text) > digits:
+        too_long = is_digit[:len(text)-digits].copy()
+        for i in range(1, digits+1):
+            too_long &= is_digit[i:len(text)-digits+i]
+        if too_long.any():
+            return None
+
+    if count[-1] == 0:
+        # only whitespaces
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+
+    # after checks above there are only numbers separated by whitespaces
+    values = np.fromstring(chunk.replace(b",", b" "), dtype=np.int64, sep=" ")
+    if len(values) != count[-1]:
+        return None
+    if len(values) and (values.min() < 1 or values.max() > _INT32_MAX):
+        return None
+    values = values.astype(np.int32)
+    return values[0::2], values[1::2]
+
+class _SharedCSR:
+    '''
+    Compact CSR adjacency placed in shared memory: offsets (int64, n+2) and then neighbors (int32)
+    Processes attach to it by name and read it without copying
+    '''
+    def __init__(self, name: str, n: int, m: int, shm=None):
+        self.shm = shm or shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.n = n
+        self.m = m
+        self.offsets = self.shm.buf[:8*(n+2)].cast('q')
+        self.neighbors = self.shm.buf[8*(n+2):8*(n+2)+4*m].cast('i')
+
+    def create(graph):
+        '''
+        Copy adjacency of graph (list of lists or CSR) to new block of shared memory
+        '''
+        n = len(graph) - 1
+        m = sum(len(graph[v]) for v in range(n+1))
+        shm = shared_memory.SharedMemory(create=True, size=8*(n+2) + 4*m)
+        ret = _SharedCSR(shm.name, n, m, shm)
+        pos = 0
+        for v in range(n+1):
+            neighbors = graph[v]
+            ret.offsets[v] = pos
+            ret.neighbors[pos:pos+len(neighbors)] = array('i', neighbors)
+            pos += len(neighbors)
+        ret.offsets[n+1] = pos
+        return ret
+
+    def __len__(self):
+        return self.n + 1
+
+    def __getitem__(self, v: int):
+        return self.neighbors[self.offsets[v]:self.offsets[v+1]]
+
+    def close(self):
+        self.offsets.release()
+        self.neighbors.release()
+        self.shm.close()
+
+# graph of worker process of Graph.multi_order, attached once by _attach_shared_graph
+_shared_graph = None
+
+def _attach_shared_graph(name: str, n: int, m: int) -> None:
+    global _shared_graph
+    _shared_graph = Graph()
+    _shared_graph.n = n
+    _shared_graph.graph = _SharedCSR(name, n, m)
+    _shared_graph.graph_exist = True
+
+def _shared_orders(starts: list, method: str) -> list:
+    order = _shared_graph.dfs_order if method == "dfs" else _shared_graph.bfs_order
+    return [(start, order(start)) for start in starts]
+
 class Graph:
     def __init__(self):
         self.graph_exist = False
@@ -7,10 +258,11 @@ class Graph:
     def _is_arg_number(x: int):
         return isinstance(x, int) and x > 0
 
-    def create_graph(self, n: int, edges: list, is_undirected=True) -> None:
+    def create_graph(self, n: int, edges: list, is_undirected=True, csr=False) -> None:
         '''
         n - number of vertices
         edges - list of tuples (a, b), that indicate in graph there are edge from a to b
+        csr - store adjacency as compact arrays (class CSR) instead of list of lists
         Vertices numbered from 1 to n inclusively
         Return False if n does not positive integer or edges does not match the format
         '''
@@ -25,43 +277,213 @@ class Graph:
                 return
 
         self.n = n 
+        self.is_undirected = is_undirected
+        # computed components, see connected_components
+        self.cache = dict()
 
-        # Adjacency list of graph
-        self.graph = [[] for _ in range(n+1)]
+        if csr:
+            self.graph = CSR(n, edges, is_undirected)
+        else:
+            # Adjacency list of graph
+            self.graph = [[] for _ in range(n+1)]
 
-        for a, b in edges:
-            self.graph[a].append(b)
+            for a, b in edges:
+                self.graph[a].append(b)
+                if is_undirected:
+                    self.graph[b].append(a)
+
+        self.graph_exist = True
+
+    def load_edges(self, path: str, n=None, is_undirected=True, chunk_size=2**24) -> None:
+        '''
+        Create graph with CSR adjacency from file with one edge "a b" or "a,b" per line
+        n - number of vertices, if not specified it is maximal vertex in file
+        File is read by chunks of chunk_size bytes two times: for counting degrees and
+            for filling neighbors, so in memory are only chunk and resulting arrays
+        If n is wrong or file does not match the format, graph is not created as in create_graph
+        Requires numpy
+        '''
+        if np is None:
+            raise ImportError("Graph.load_edges requires numpy")
+        self.graph_exist = False
+        if n is not None and not Graph._is_arg_number(n):
+            return
+
+        # first pass: validation and degrees
+        degree = np.zeros(1 if n is None else n+1, dtype=np.int64)
+        for chunk in _read_chunks(path, chunk_size):
+            edges = _parse_edges(chunk)
+            if edges is None:
+                return
+            # both ends must be vertices, but only sources get degree in directed graph
+            for ends in edges:
+                if len(ends) and (ends.min() < 1 or ends.max() >= len(degree)):
+                    if n is not None or ends.min() < 1:
+                        return
+                    degree = np.concatenate((degree, np.zeros(int(ends.max()) + 1 - len(degree), dtype=np.int64)))
+            for ends in edges[:1 + is_undirected]:
+                degree += np.bincount(ends, minlength=len(degree))
+        if len(degree) < 2:
+            # no vertices
+            return
+        n = len(degree) - 1
+
+        # second pass: every chunk is sorted by source vertex and put to free places of vertices
+        offsets = np.concatenate(([0], np.cumsum(degree)))
+        neighbors = np.zeros(offsets[-1], dtype=np.int32)
+        pos = offsets[:-1].copy()
+        for chunk in _read_chunks(path, chunk_size):
+            a, b = _parse_edges(chunk)
             if is_undirected:
-                self.graph[b].append(a)
+                # interleave a->b and b->a to keep order of create_graph
+                a, b = np.stack((a, b), axis=1).ravel(), np.stack((b, a), axis=1).ravel()
+            order = np.argsort(a, kind="stable")
+            a, b = a[order], b[order]
+            # rank of edge among edges of the same vertex in chunk
+            first = np.flatnonzero(np.concatenate(([True], a[1:] != a[:-1])))
+            rank = np.arange(len(a)) - np.repeat(first, np.diff(np.append(first, len(a))))
+            neighbors[pos[a] + rank] = b
+            pos += np.bincount(a, minlength=n+1)
 
+        self.n = n
+        self.is_undirected = is_undirected
+        self.cache = dict()
+        self.graph = CSR.from_arrays(offsets, neighbors)
         self.graph_exist = True
 
+    def _is_edge_list(self, edges: list) -> bool:
+        for i in edges:
+            try:
+                if len(i) != 2 or not Graph._is_arg_number(i[0]) or not Graph._is_arg_number(i[1]):
+                    return False
+            except:
+                return False
+            if i[0] > self.n or i[1] > self.n:
+                return False
+        return True
+
+    def add_vertices(self, k=1):
+        '''
+        Add k isolated vertices with numbers n+1, ..., n+k
+        Components of new vertices are added to cached components
+        If graph wasn't initialized or k is not positive integer, return False
+        '''
+        if not self.graph_exist or not Graph._is_arg_number(k):
+            return False
+        if isinstance(self.graph, CSR):
+            self.graph.add_vertices(k)
+        else:
+            self.graph.extend([] for _ in range(k))
+        for comp in self.cache.values():
+            # every new vertex is separate component
+            last = max(comp)
+            comp.extend(range(last+1, last+k+1))
+        self.n += k
+        return True
+
+    def add_edges(self, edges: list):
+        '''
+        Add edges (a, b) to graph, for undirected graph also (b, a)
+        Cached components are kept if all edges lie inside one component
+        If graph wasn't initialized or edges does not match the format, return False and graph isn't changed
+        '''
+        if not self.graph_exist or not self._is_edge_list(edges):
+            return False
+        for a, b in edges:
+            for name in ("components", "scc"):
+                if name in self.cache and self.cache[name][a] != self.cache[name][b]:
+                    # components can merge
+                    del self.cache[name]
+            if isinstance(self.graph, CSR):
+                self.graph.append(a, b)
+                if self.is_undirected:
+                    self.graph.append(b, a)
+            else:
+                self.graph[a].append(b)
+                if self.is_undirected:
+                    self.graph[b].append(a)
+        if isinstance(self.graph, CSR) and self.graph.need_compaction():
+            self.graph.compact()
+        return True
+
+    def remove_edges(self, edges: list):
+        '''
+        Remove one occurrence of every edge (a, b) from graph, for undirected graph also (b, a)
+        Edges which are absent in graph are skipped
+        Cached strongly connected components are kept if edge connects different components,
+            other cached components are kept if edge was parallel to another one or loop
+        If graph wasn't initialized or edges does not match the format, return False and graph isn't changed
+        '''
+        if not self.graph_exist or not self._is_edge_list(edges):
+            return False
+        for a, b in edges:
+            if isinstance(self.graph, CSR):
+                if not self.graph.remove(a, b):
+                    continue
+                if self.is_undirected:
+                    self.graph.remove(b, a)
+            else:
+                if b not in self.graph[a]:
+                    continue
+                self.graph[a].remove(b)
+                if self.is_undirected:
+                    self.graph[b].remove(a)
+
+            if a == b:
+                continue
+            if "scc" in self.cache and self.cache["scc"][a] == self.cache["scc"][b]:
+                # component can split
+                del self.cache["scc"]
+            if "components" in self.cache and b not in self.graph[a] and a not in self.graph[b]:
+                # it was the only edge between a and b, so component can split
+                del self.cache["components"]
+        return True
+
     def dfs_order(self, start: int):
         '''
         Return list of vertices how they will be visited by depth-first search (dfs)
             starting with start vertex
         If was error in initializing graph or start vertex doesn't exist, return False
         '''
+        ret = self.iter_dfs(start)
+        if ret is False:
+            return False
+        return list(ret)
+
+    def iter_dfs(self, start: int):
+        '''
+        Same as dfs_order, but return generator which yields vertices when they are visited,
+            so traversal can be stopped early without visiting whole graph
+        If was error in initializing graph or start vertex doesn't exist, return False
+        '''
         if not self.graph_exist:
             return False
         if not Graph._is_arg_number(start) or start > self.n:
             return False
 
-        return self.__dfs(start, [False]*(self.n+1))
+        return self.__dfs(start)
 
-    def __dfs(self, cur: int, was: list):
+    def __dfs(self, start: int):
         '''
-        Actual dfs algorithm
-        cur - current vertex in dfs
-        was - list of bool valuies, where was[i] indicate was i-th vertex visited
-        ret - initially empty list, we will add vertex there when we visit it
+        Actual dfs algorithm, without recursion
+        stack keeps iterators over neighbors of vertices on current path,
+            so every edge is checked once and order is the same as in recursive dfs
         '''
-        was[cur] = True
-        ret = [cur]
-        for next in self.graph[cur]:
-            if not was[next]:
-                ret += self.__dfs(next, was)
-        return ret
+        # was[i] indicate was i-th vertex visited
+        was = bytearray(self.n+1)
+        was[start] = True
+        yield start
+        stack = [iter(self.graph[start])]
+        while stack:
+            for next in stack[-1]:
+                if not was[next]:
+                    was[next] = True
+                    yield next
+                    stack.append(iter(self.graph[next]))
+                    break
+            else:
+                # all neighbors of vertex are visited, return to previous one
+                stack.pop()
 
     def bfs_order(self, start: int):
         '''
@@ -74,20 +496,246 @@ class Graph:
         if not Graph._is_arg_number(start) or start > self.n:
             return False
 
-        was = [False]*(self.n+1)
-        stack = [start]
+        was = bytearray(self.n+1)
+        queue = deque([start])
         was[start] = True
         ret = []
 
-        while len(stack) > 0:
-            # get and delete last unvisited vertex
-            cur = stack.pop(-1)
-
-            # mark vertex as visited
+        while queue:
+            # get and delete first vertex in queue
+            cur = queue.popleft()
             ret.append(cur)
 
             for next in self.graph[cur]:
                 if not was[next]:
                     was[next] = True
-                    stack.append(next)
-        return ret
\ No newline at end of file
+                    queue.append(next)
+        return ret
+
+    def bfs(self, starts, frontier=False):
+        '''
+        Breadth-first search from one vertex or list of vertices at once
+        Return tuple (dist, parent) of lists of size n+1:
+            dist[v] - number of edges in shortest path from nearest start vertex, -1 if v is unreachable
+            parent[v] - previous vertex in such path, 0 for start and unreachable vertices
+        frontier - process whole level of bfs at once by numpy, only for graph created with csr=True
+            In this mode dist and parent are numpy arrays, parents may differ but are also shortest
+        If was error in initializing graph or some start vertex doesn't exist, return False
+        '''
+        if not self.graph_exist:
+            return False
+        if isinstance(starts, int):
+            starts = [starts]
+        for v in starts:
+            if not Graph._is_arg_number(v) or v > self.n:
+                return False
+        if frontier:
+            if not isinstance(self.graph, CSR) or np is None:
+                return False
+            return self.__bfs_frontier(starts)
+
+        dist = [-1]*(self.n+1)
+        parent = [0]*(self.n+1)
+        queue = deque()
+        for v in starts:
+            if dist[v] == -1:
+                dist[v] = 0
+                queue.append(v)
+
+        while queue:
+            cur = queue.popleft()
+            for next in self.graph[cur]:
+                if dist[next] == -1:
+                    dist[next] = dist[cur] + 1
+                    parent[next] = cur
+                    queue.append(next)
+        return (dist, parent)
+
+    def __bfs_frontier(self, starts: list):
+        '''
+        Level-synchronous bfs over CSR arrays: all edges going from current level
+            are gathered and filtered by vectorized operations
+        '''
+        offsets = np.frombuffer(self.graph.offsets, dtype=np.int64)
+        degree = np.frombuffer(self.graph.degree, dtype=np.int32)
+        neighbors = np.frombuffer(self.graph.neighbors, dtype=np.int32)
+        dist = np.full(self.n+1, -1, dtype=np.int64)
+        parent = np.zeros(self.n+1, dtype=np.int64)
+
+        level = np.unique(np.array(starts, dtype=np.int64))
+        dist[level] = 0
+        depth = 0
+        while len(level):
+            depth += 1
+            begin = offsets[level]
+            count = degree[level].astype(np.int64)
+            total = count.sum()
+            if not total:
+                break
+            # positions of all edges of level in neighbors array
+            shift = np.repeat(begin - (np.cumsum(count) - count), count)
+            next = neighbors[np.arange(total) + shift]
+            source = np.repeat(level, count)
+
+            new = dist[next] == -1
+            next, first = np.unique(next[new], return_index=True)
+            dist[next] = depth
+            parent[next] = source[new][first]
+            level = next.astype(np.int64)
+        return (dist, parent)
+
+    def connected_components(self):
+        '''
+        Return list comp of size n+1, where comp[v] is number of connected component of vertex v
+            components are numbered from 1 in order of their smallest vertex
+        For directed graph direction of edges is ignored (weakly connected components)
+        Found by union-find with path compression, result is cached until graph changes
+        If graph wasn't initialized, return False
+        '''
+        if not self.graph_exist:
+            return False
+        if "components" not in self.cache:
+            self.cache["components"] = self.__union_find_components()
+        return self.cache["components"]
+
+    def __union_find_components(self):
+        parent = list(range(self.n+1))
+        size = [1]*(self.n+1)
+
+        def find(v: int) -> int:
+            root = v
+            while parent[root] != root:
+                root = parent[root]
+            # path compression: all vertices on path now point to root
+            while parent[v] != root:
+                parent[v], v = root, parent[v]
+            return root
+
+        for v in range(1, self.n+1):
+            for u in self.graph[v]:
+                a, b = find(v), find(u)
+                if a != b:
+                    # union by size
+                    if size[a] < size[b]:
+                        a, b = b, a
+                    parent[b] = a
+                    size[a] += size[b]
+
+        comp = [0]*(self.n+1)
+        number = dict()
+        for v in range(1, self.n+1):
+            comp[v] = number.setdefault(find(v), len(number)+1)
+        return comp
+
+    def strongly_connected_components(self):
+        '''
+        Return list comp of size n+1, where comp[v] is number of strongly connected component of vertex v
+            components are numbered from 1 in reverse topological order
+        Found by iterative Tarjan's algorithm, result is cached until graph changes
+        If graph wasn't initialized, return False
+        '''
+        if not self.graph_exist:
+            return False
+        if "scc" not in self.cache:
+            self.cache["scc"] = self.__tarjan()
+        return self.cache["scc"]
+
+    def __tarjan(self):
+        # index[v] - time when v was visited, 0 if it wasn't
+        # low[v] - minimal index reachable from subtree of v by vertices on stack
+        index = [0]*(self.n+1)
+        low = [0]*(self.n+1)
+        on_stack = bytearray(self.n+1)
+        stack = []
+        comp = [0]*(self.n+1)
+        time = 1
+        comp_number = 0
+
+        for start in range(1, self.n+1):
+            if index[start]:
+                continue
+            index[start] = low[start] = time
+            time += 1
+            stack.append(start)
+            on_stack[start] = True
+            # path of dfs with iterators over neighbors instead of recursion
+            path = [(start, iter(self.graph[start]))]
+            while path:
+                v, neighbors = path[-1]
+                for u in neighbors:
+                    if not index[u]:
+                        index[u] = low[u] = time
+                        time += 1
+                        stack.append(u)
+                        on_stack[u] = True
+                        path.append((u, iter(self.graph[u])))
+                        break
+                    if on_stack[u]:
+                        low[v] = min(low[v], index[u])
+                else:
+                    path.pop()
+                    if path:
+                        prev = path[-1][0]
+                        low[prev] = min(low[prev], low[v])
+                    if low[v] == index[v]:
+                        # v is root of component, all vertices above it on stack belong to it
+                        comp_number += 1
+                        while True:
+                            u = stack.pop()
+                            on_stack[u] = False
+                            comp[u] = comp_number
+                            if u == v:
+                                break
+        return comp
+
+    def same_component(self, a: int, b: int, strong=False):
+        '''
+        Check if vertices a and b lie in the same connected (or strongly connected) component
+        If graph wasn't initialized or vertices don't exist, return False
+        '''
+        comp = self.strongly_connected_components() if strong else self.connected_components()
+        if comp is False:
+            return False
+        for v in (a, b):
+            if not Graph._is_arg_number(v) or v > self.n:
+                return False
+        return comp[a] == comp[b]
+
+    def component_sizes(self, strong=False):
+        '''
+        Return histogram of sizes of components as dict {size: number_of_components}, sorted by size
+        If graph wasn't initialized, return False
+        '''
+        comp = self.strongly_connected_components() if strong else self.connected_components()
+        if comp is False:
+            return False
+        sizes = Counter(comp[1:])
+        return dict(sorted(Counter(sizes.values()).items()))
+
+    def multi_order(self, starts: list, method="dfs", workers=None, chunksize=64):
+        '''
+        Traversal orders (dfs_order or bfs_order, by method) from many start vertices by pool of processes
+        Adjacency is copied once to shared memory, workers read it without copying
+        Return generator of pairs (start, order) in order of finishing, not of starts
+        If was error in initializing graph, start vertex doesn't exist or method is unknown, return False
+        '''
+        if not self.graph_exist or method not in ("dfs", "bfs"):
+            return False
+        starts = list(starts)
+        for v in starts:
+            if not Graph._is_arg_number(v) or v > self.n:
+                return False
+        return self.__multi_order(starts, method, workers, chunksize)
+
+    def __multi_order(self, starts: list, method: str, workers, chunksize: int):
+        adjacency = _SharedCSR.create(self.graph)
+        try:
+            with ProcessPoolExecutor(workers, initializer=_attach_shared_graph,
+                                     initargs=(adjacency.name, adjacency.n, adjacency.m)) as pool:
+                tasks = [pool.submit(_shared_orders, starts[i:i+chunksize], method)
+                         for i in range(0, len(starts), chunksize)]
+                for task in as_completed(tasks):
+                    yield from task.result()
+        finally:
+            adjacency.close()
+            adjacency.shm.unlink()
@@ -0,0 +1,195 @@
+from array import array
+from itertools import compress
+
+from functions import _raise_if_not_integer, solve_2_sat
+
+class TwoSat:
+    '''
+    2-SAT solver which keeps implication graph and solution between queries
+    Disjunctions can be added one by one, and formula can be solved under assumptions,
+        which are stack of levels of literals, the last level can be retracted
+    Literals are designated as in solve_2_sat: a for variable a and -a for !a
+    '''
+    def __init__(self, dis=()) -> None:
+        '''
+        Create solver, if dis is passed, solution for it is found by solve_2_sat at once
+        '''
+        self.n = 0
+        # graph[v] - list of literals implied by literal v, v^(!v) = 1 as in solve_2_sat
+        self.graph = []
+        # model[v] is 1 if literal v is true in solution of all disjunctions
+        self.model = bytearray()
+        self.satisfiable = True
+        # assigned[v] is 1 if literal v is implied by assumptions
+        self.assigned = bytearray()
+        self.trail = []
+        # pairs (literals, length of trail before them) for every level of assumptions
+        self.levels = []
+        # number of first level with contradiction, or None
+        self.conflict = None
+        # seen[v] == epoch if literal v was reached in current search
+        self.seen = array('i')
+        self.epoch = 0
+
+        dis = list(dis)
+        for a, b in dis:
+            a = self.__literal(a)
+            b = self.__literal(b)
+            self.graph[a^1].append(b)
+            self.graph[b^1].append(a)
+        ret = solve_2_sat(dis)
+        if ret is False:
+            self.satisfiable = False
+            return
+        for v in ret:
+            self.model[2*v - 2] = 1
+            self.model[2*v - 1] = 0
+
+    def __literal(self, x: int) -> int:
+        '''
+        Internal function: number of vertex of literal x, new variables are created if needed
+        '''
+        _raise_if_not_integer(x)
+        if x == 0:
+            raise ValueError("variables must be nonzero integers")
+        while self.n < abs(x):
+            self.n += 1
+            self.graph += [[], []]
+            # new variable is false
+            self.model += b"\x00\x01"
+            self.assigned += b"\x00\x00"
+            self.seen += array('i', [0, 0])
+        return 2*x - 2 if x > 0 else -2*x - 1
+
+    def add_clauses(self, dis) -> bool:
+        '''
+        Add disjunctions (pairs (a, b) which mean that there is (a || b)) to formula
+        Solution is repaired only if new disjunction is false in it
+        Return is formula still satisfiable (without assumptions)
+        '''
+        for a, b in dis:
+            a = self.__literal(a)
+            b = self.__literal(b)
+            self.graph[a^1].append(b)
+            self.graph[b^1].append(a)
+            if self.satisfiable and not self.model[a] and not self.model[b]:
+                self.__repair(a, b)
+            if self.levels and (self.assigned[a^1] or self.assigned[b^1]):
+                # assumptions imply one of new edges
+                self.__replay()
+        return self.satisfiable
+
+    def __repair(self, a: int, b: int) -> None:
+        # if all literals implied by a don't contradict each other, they can be set true over solution:
+        # any disjunction with false literal from them has other literal among them
+        # if both a and b imply contradiction, formula can't be satisfied
+        for start in (a, b):
+            reached = self.__closure(start)
+            if reached is not False:
+                for v in reached:
+                    self.model[v] = 1
+                    self.model[v^1] = 0
+                return
+        self.satisfiable = False
+
+    def __closure(self, start: int):
+        '''
+        Internal function: list of literals implied by start, or False if they contradict each other
+        '''
+        self.epoch += 1
+        epoch = self.epoch
+        seen = self.seen
+        seen[start] = epoch
+        reached = [start]
+        for v in reached:
+            for u in self.graph[v]:
+                if seen[u] != epoch:
+                    if seen[u^1] == epoch:
+                        return False
+                    seen[u] = epoch
+                    reached.append(u)
+        return reached
+
+    def assume(self, literals) -> bool:
+        '''
+        Add new level of assumptions, all its literals are considered true until retract
+        Return is formula satisfiable under all assumptions
+        '''
+        return self.__push([self.__literal(x) for x in literals])
+
+    def __push(self, literals: list) -> bool:
+        self.levels.append((literals, len(self.trail)))
+        if self.conflict is None and not self.__propagate(literals):
+            self.conflict = len(self.levels) - 1
+        return self.satisfiable and self.conflict is None
+
+    def retract(self):
+        '''
+        Remove last level of assumptions
+        If there are no assumptions, return False
+        '''
+        if not self.levels:
+            return False
+        literals, mark = self.levels.pop()
+        for v in self.trail[mark:]:
+            self.assigned[v] = 0
+        del self.trail[mark:]
+        if self.conflict == len(self.levels):
+            self.conflict = None
+        return True
+
+    def __propagate(self, literals: list) -> bool:
+        # in satisfiable 2-SAT formula literals can be true together
+        # iff literals implied by them don't contradict each other
+        assigned = self.assigned
+        trail = self.trail
+        for start in literals:
+            if assigned[start]:
+                continue
+            if assigned[start^1]:
+                return False
+            assigned[start] = 1
+            i = len(trail)
+            trail.append(start)
+            while i < len(trail):
+                for u in self.graph[trail[i]]:
+                    if not assigned[u]:
+                        if assigned[u^1]:
+                            return False
+                        assigned[u] = 1
+                        trail.append(u)
+                i += 1
+        return True
+
+    def __replay(self) -> None:
+        # assumptions are propagated again from the first level
+        levels = [literals for literals, mark in self.levels]
+        while self.levels:
+            self.retract()
+        for literals in levels:
+            self.__push(literals)
+
+    def check(self, assumptions=()) -> bool:
+        '''
+        Check if formula is satisfiable under all assumptions and additional temporary ones
+        It costs only search from assumed literals, without solving formula again
+        '''
+        ret = self.assume(assumptions)
+        self.retract()
+        return ret
+
+    def solve(self, assumptions=()):
+        '''
+        Solve formula under all assumptions and additional temporary ones
+        Return False if solution doesn't exist, or list of variables with true value
+        '''
+        if not self.assume(assumptions):
+            self.retract()
+            return False
+        # solution of formula, where literals implied by assumptions are set true
+        model = bytearray(self.model)
+        for v in self.trail:
+            model[v] = 1
+            model[v^1] = 0
+        self.retract()
+        return list(compress(range(1, self.n + 1), model[0::2]))
@@ -1,5 +1,9 @@
+import os
+import tempfile
+
 from Graph import Graph
 from CRT import CRT
+from TwoSat import TwoSat
 from functions import *
 
 
@@ -13,7 +17,39 @@ print(G.dfs_order(3)) # [3, 2, 1, 4, 5], 3
 # Graph breadth-first search
 G = Graph()
 G.create_graph(4, [(1, 3), (3, 1), (1, 2), (2, 3), (3, 4), (4, 4)], False)
-print(G.bfs_order(3)) # [3, 4, 1, 2], 3
+print(G.bfs_order(3)) # [3, 1, 4, 2], 3
+
+# Distances and parents in shortest paths from several vertices
+print(G.bfs([2, 4])) # ([-1, 2, 0, 1, 0], [0, 3, 0, 2, 0])
+
+# Same graph with compact CSR adjacency
+G = Graph()
+G.create_graph(4, [(1, 3), (3, 1), (1, 2), (2, 3), (3, 4), (4, 4)], False, csr=True)
+print(G.bfs_order(3)) # [3, 1, 4, 2], 3
+
+# Graph from file with edge list, read by chunks (here tiny ones), blank lines are skipped
+path = os.path.join(tempfile.mkdtemp(), "edges.txt")
+with open(path, "w") as file:
+    file.write("1 3\n3,1\n1 2\n2 3\n3 4\n4 4\n\n\n")
+G = Graph()
+G.load_edges(path, is_undirected=False, chunk_size=4)
+print(G.bfs_order(3)) # [3, 1, 4, 2], 3
+os.remove(path)
+
+# Connected and strongly connected components
+G = Graph()
+G.create_graph(6, [(1, 2), (2, 3), (3, 1), (3, 4), (5, 6)], False)
+print(G.connected_components()) # [0, 1, 1, 1, 1, 2, 2]
+print(G.strongly_connected_components()) # [0, 2, 2, 2, 1, 4, 3]
+print(G.same_component(1, 3, strong=True)) # True
+print(G.component_sizes(strong=True)) # {1: 3, 3: 1}
+
+# Changing graph without rebuilding
+G.add_vertices(1)
+G.add_edges([(4, 1), (6, 7)])
+G.remove_edges([(3, 1)])
+print(G.strongly_connected_components()) # [0, 1, 1, 1, 1, 4, 3, 2]
+print(G.connected_components()) # [0, 1, 1, 1, 1, 2, 2, 2]
 
 # 2-SAT solver
 # on this example (a || c) && (!a || !d) && (b || !d) && (b || !e) && (c || d)
@@ -21,11 +57,24 @@ print(solve_2_sat([(1,  3), (-1,  -4), (2 , -4) , (2 , -5), (3, 4)])) #
 # on this example (!a || !a)
 print(solve_2_sat([(-1, -1)])) #
 
+# 2-SAT solver keeping graph between queries
+S = TwoSat([(1,  3), (-1,  -4)])
+S.add_clauses([(2 , -4) , (2 , -5), (3, 4)])
+print(S.solve()) # [1, 2, 3]
+S.assume([4])
+print(S.solve()) # [2, 3, 4]
+print(S.check([-3])) # False
+S.retract()
+print(S.solve([-1])) # [2, 3]
+
 
 # prime factorization
 print(factorization(452)) # [(2, 2), (113, 1)], 452
 print(factorization(5670)) #  [(2, 1), (3, 4), (5, 1), (7, 1)], 5670
 
+# many numbers at once by table of smallest prime factors, with Euler function
+print(factorization_many([12, 30, 97], phi=True)) # ([[(2, 2), (3, 1)], [(2, 1), (3, 1), (5, 1)], [(97, 1)]], [4, 8, 96])
+
 # Sieve of Eratosthenes
 print("Prime numbers before 100:", ", ".join(map(str, sieve_of_eratosthenes(100, True))))
 print("Prime numbers before 200:", ", ".join(map(str, sieve_of_eratosthenes(200, True))))
@@ -35,6 +84,9 @@ print(gcd, 5, 10) # 6
 print(gcd, 5670, 12690) # 270
 print(gcd, 567, 16) # 1
 
+# gcd of every number with product of others, for many numbers at once
+print(batch_gcd([15, 77, 221, 35])) # [5, 7, 1, 35]
+
 # gcd and lcm of many numbers
 print(gcd_lcm_of_numbers(567, 126, 21, 3)) # (3, 1134)
 print(gcd_lcm_of_numbers(567, 126, 21)) # (21, 1134)
@@ -48,6 +100,7 @@ print(gcd_ext(2, 4)) # (1, 0)
 print(inverse_modulo(3, 26)) # 9
 print(inverse_modulo(4, 26)) # False
 print(inverse_modulo(1234, 12345)) # 9874
+print(inverse_modulo_many([3, 4, 1234, 5], 26)) # [9, False, False, 21]
 
 # Chinese Remainder Theorem (cheenese_remainder_theorem)
 print(CRT.cheenese_remainder_theorem([35, 45], [50, 47])) # 985
@@ -1,3 +1,24 @@
+import math
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, chain, compress
+from math import isqrt
+from operator import eq, lt
+
+try:
+    from gmpy2 import mpz
+except ImportError:
+    # gmpy2 only speeds up batch_gcd, python integers have quadratic division of big numbers
+    mpz = None
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy only speeds up building of graph in solve_2_sat
+    np = None
+
 def _raise_if_not_positive_integer(x) -> None:
     '''
     Internal_finction for checking function arguments is they positive number
@@ -16,55 +37,264 @@ def _raise_if_not_integer(x) -> None:
 
 def factorization(num: int) -> list:
     '''
-    Optimized algorithm for factorization - check divisors only for sqrt(num)
+    Factorization in three stages: trial division by small primes, then
+        remaining part is split by Pollard's rho algorithm until all factors are prime
+        by Miller-Rabin test
     return list of tuples (prime_number, multiplier_degree)
     '''
     _raise_if_not_positive_integer(num)
-    ret = list()
-    for p in range(2, num):
+    count = Counter()
+    for p in _small_primes():
         if p*p > num:
             # optimization
             break
-
-        count = 0
         while num%p == 0:
-            count += 1
+            count[p] += 1
             num //= p
 
-        if count:
-            ret.append((p, count))
+    # every factor of num is bigger than small primes
+    stack = [num]
+    while stack:
+        cur = stack.pop()
+        if cur == 1:
+            continue
+        if is_prime(cur):
+            count[cur] += 1
+        else:
+            divisor = _pollard_brent(cur)
+            stack += [divisor, cur // divisor]
 
-    if num > 1:
-        # case when num is prime number or have one big prime divisor
-        ret.append((num, 1))
+    return sorted(count.items())
 
-    return ret
+@lru_cache(maxsize=None)
+def _small_primes() -> tuple:
+    '''
+    Internal function: primes for trial division, computed once
+    '''
+    return sieve_of_eratosthenes(1000, True)
 
-def sieve_of_eratosthenes(num: int, need_only_primes=False) -> list:
+# with these bases Miller-Rabin test is exact for numbers less than 3.3 * 10^24
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def is_prime(num: int) -> bool:
+    '''
+    Miller-Rabin primality test, deterministic for numbers less than 3.3 * 10^24,
+        for bigger numbers probability of mistake is less than 4^(-13)
+    '''
+    _raise_if_not_positive_integer(num)
+    if num < 2:
+        return False
+    for p in _MILLER_RABIN_BASES:
+        if num%p == 0:
+            return num == p
+
+    # num - 1 = d * 2^s, where d is odd
+    d = num - 1
+    s = 0
+    while d%2 == 0:
+        d //= 2
+        s += 1
+
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, num)
+        if x == 1 or x == num-1:
+            continue
+        for _ in range(s-1):
+            x = x*x % num
+            if x == num-1:
+                break
+        else:
+            # a is witness that num is composite
+            return False
+    return True
+
+def _pollard_brent(num: int) -> int:
+    '''
+    Internal function: find non-trivial divisor of composite num by Pollard's rho algorithm
+        with Brent's cycle detection, products of differences are accumulated
+        to compute gcd once per batch of steps
+    '''
+    if num%2 == 0:
+        return 2
+    batch = 128
+    for c in range(1, num):
+        # sequence y = y*y + c (mod num)
+        y, r, q, g = 2, 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y*y + c) % num
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch, r-k)):
+                    y = (y*y + c) % num
+                    q = q * abs(x-y) % num
+                g = math.gcd(q, num)
+                k += batch
+            r *= 2
+        if g == num:
+            # batch went too far, repeat it step by step
+            g = 1
+            while g == 1:
+                ys = (ys*ys + c) % num
+                g = math.gcd(abs(x-ys), num)
+        if g != num:
+            return g
+        # cycle without divisor, try other c
+    return num
+
+def _odd_sieve(num: int) -> bytearray:
+    '''
+    Internal function: sieve only for odd numbers, odd[i] indicate is 2*i+1 prime number
+    Multiples are crossed off by slice assignment, only for primes up to sqrt(num)
+    '''
+    size = (num+1) // 2
+    odd = bytearray([1]) * size
+    odd[0] = 0 # 1 is not prime
+    for i in range(1, (isqrt(num)-1)//2 + 1):
+        if odd[i]:
+            p = 2*i + 1
+            # start from p*p, because smaller multiples are crossed off by smaller primes
+            # step p in indexes is step 2*p in numbers, so even multiples are skipped
+            start = p*p // 2
+            odd[start::p] = bytes((size - 1 - start)//p + 1)
+    return odd
+
+def sieve_of_eratosthenes(num: int, need_only_primes=False):
     '''
     Optimized realization of sieve of Eratosphenes
-    Return list of bool values, where sieve[i] indicate is i prime number
+    Return bytearray of 0/1 values, where sieve[i] indicate is i prime number
+    If need_only_primes, return tuple of prime numbers up to num
     '''
     _raise_if_not_positive_integer(num)
-    
-    sieve = [True]*(num+1)
-    sieve[0] = False
-    sieve[1] = False
-
-    for i in range(num+1):
-        if sieve[i]:
-            for j in range(i*i, num+1, i):
-                # optimized with start from i*i, because numbers from 2*i to (i-1)*i
-                # calculated before
-                sieve[j] = False
-    if not need_only_primes:
-        return sieve
-
-    primes = list()
-    for i in range(num+1):
-        if sieve[i]:
-            primes.append(i)
-    return tuple(primes)
+
+    odd = _odd_sieve(num)
+    if need_only_primes:
+        primes = compress(range(1, num+1, 2), odd)
+        return tuple(chain((2,), primes) if num >= 2 else primes)
+
+    sieve = bytearray(num+1)
+    sieve[1::2] = odd
+    if num >= 2:
+        sieve[2] = 1
+    return sieve
+
+def iter_primes(limit=None, segment_size=2**18):
+    '''
+    Generator of prime numbers up to limit inclusively, or endless if limit is None
+    Segmented sieve: odd numbers are sieved by blocks of segment_size,
+        so memory is bounded by block and primes up to sqrt of current number
+    '''
+    if limit is not None:
+        _raise_if_not_positive_integer(limit)
+    _raise_if_not_positive_integer(segment_size)
+    if limit is not None and limit < 2:
+        return
+    yield 2
+
+    base = ()
+    base_limit = 0
+    # segment contains odd numbers low, low+2, ..., high-2
+    low = 3
+    while limit is None or low <= limit:
+        high = low + 2*segment_size
+        if limit is not None:
+            high = min(high, limit + 1 + limit % 2)
+        if isqrt(high) > base_limit:
+            base_limit = max(2*base_limit, isqrt(high))
+            base = sieve_of_eratosthenes(base_limit, True)[1:]
+
+        segment = bytearray([1]) * ((high - low) // 2)
+        for p in base:
+            if p*p >= high:
+                break
+            # first odd multiple of p in segment, but not less than p*p
+            start = max(p*p, (low + p - 1) // p * p)
+            if start % 2 == 0:
+                start += p
+            i = (start - low) // 2
+            segment[i::p] = bytes((len(segment) - 1 - i)//p + 1) if i < len(segment) else b""
+        yield from compress(range(low, high, 2), segment)
+        low = high
+
+_spf_table = array('i')
+
+def smallest_prime_factors(num: int) -> array:
+    '''
+    Table of smallest prime factors: spf[i] is the smallest prime divisor of i (spf[1] = 1)
+    Return compact array of int32, table is kept between calls and only rebuilt
+        if bigger num is needed
+    '''
+    _raise_if_not_positive_integer(num)
+    if num > 2**31 - 1:
+        raise ValueError("num is too big for table of int32")
+    return _get_spf_table(num)[:num+1]
+
+def _get_spf_table(num: int) -> array:
+    '''
+    Internal function: shared table of smallest prime factors with length more than num
+    '''
+    global _spf_table
+    if len(_spf_table) > num:
+        return _spf_table
+
+    # build for some reserve, so growing queries don't rebuild table every time
+    size = max(num, 2*(len(_spf_table) - 1)) + 1
+    size = min(size, 2**31)
+    spf = array('i', range(size))
+    spf[4::2] = array('i', [2]) * ((size - 5)//2 + 1) if size > 4 else array('i')
+    # the biggest primes go first, so every number is overwritten last by its smallest prime
+    for p in reversed(sieve_of_eratosthenes(isqrt(size - 1), True)[1:]):
+        # multiples less than p*p or even ones have smaller prime divisor
+        start = p*p
+        spf[start::2*p] = array('i', [p]) * ((size - 1 - start)//(2*p) + 1)
+    _spf_table = spf
+    return spf
+
+def factorization_many(numbers, phi=False, mobius=False, divisors=False):
+    '''
+    Factorization of many numbers by table of smallest prime factors, O(log n) for each number
+    Return list of factorizations in format of function factorization
+    If any of phi, mobius, divisors is True, return tuple (factorizations, *values),
+        where values are lists of Euler function, Mobius function and number of divisors
+        for each number, in that order and only requested ones
+    '''
+    numbers = list(numbers)
+    for num in numbers:
+        _raise_if_not_positive_integer(num)
+    if max(numbers, default=1) > 2**31 - 1:
+        raise ValueError("numbers are too big for table of int32")
+    spf = _get_spf_table(max(numbers, default=1))
+
+    factors = []
+    phis = []
+    mus = []
+    divs = []
+    for num in numbers:
+        cur = []
+        ph = 1
+        mu = 1
+        d = 1
+        while num > 1:
+            p = spf[num]
+            k = 0
+            while spf[num] == p:
+                num //= p
+                k += 1
+            cur.append((p, k))
+            ph *= (p - 1) * p**(k - 1)
+            mu = -mu if k == 1 else 0
+            d *= k + 1
+        factors.append(cur)
+        phis.append(ph)
+        mus.append(mu)
+        divs.append(d)
+
+    values = [v for v, need in ((phis, phi), (mus, mobius), (divs, divisors)) if need]
+    if values:
+        return (factors, *values)
+    return factors
 
 def gcd(a: int, b: int) -> int:
     '''
@@ -98,6 +328,74 @@ def gcd_lcm_of_numbers(first: int, *nums) -> tuple:
 
     return (_gcd, _lcm)
 
+def batch_gcd(numbers, workers=None, chunksize=256) -> list:
+    '''
+    For every number return gcd of it and product of all other numbers
+    Bernstein's algorithm: product tree of numbers, then remainder tree of product
+        modulo squares of nodes, so work is quasi-linear instead of all pairs
+    Levels of trees with more than chunksize nodes are processed by pool of
+        workers processes, if workers is 1 everything is computed in this process
+    For big numbers install gmpy2, it is used for arithmetic if available
+    '''
+    numbers = list(numbers)
+    for num in numbers:
+        _raise_if_not_positive_integer(num)
+    _raise_if_not_positive_integer(chunksize)
+    if not numbers:
+        return []
+    # chunks of levels must contain whole pairs of nodes
+    chunksize += chunksize % 2
+    nodes = numbers if mpz is None else [mpz(num) for num in numbers]
+
+    pool = None
+    if workers != 1 and len(numbers) > chunksize:
+        pool = ProcessPoolExecutor(workers)
+    try:
+        tree = [nodes]
+        while len(tree[-1]) > 1:
+            tree.append(_map_tree_level(pool, chunksize, _tree_products, tree[-1]))
+
+        # remainders[i] is product of all numbers modulo square of node i
+        remainders = tree.pop()
+        while tree:
+            remainders = _map_tree_level(pool, chunksize, _tree_remainders, tree.pop(), remainders)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    # remainder / num is product of other numbers modulo num
+    return [int(math.gcd(r // num, num)) for r, num in zip(remainders, nodes)]
+
+def _tree_products(level: list) -> list:
+    '''
+    Internal function: products of neighbouring nodes, last node without pair is kept
+    '''
+    products = [level[i] * level[i+1] for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        products.append(level[-1])
+    return products
+
+def _tree_remainders(level: list, parents: list) -> list:
+    '''
+    Internal function: remainders of parents modulo squares of their children
+    '''
+    return [parents[i // 2] % (node*node) for i, node in enumerate(level)]
+
+def _map_tree_level(pool, chunksize: int, function, level: list, parents=None) -> list:
+    '''
+    Internal function: apply function to level of tree by chunks in pool,
+        chunksize is even so pairs of nodes and their parent are in the same chunk
+    '''
+    if pool is None or len(level) <= chunksize:
+        return function(level) if parents is None else function(level, parents)
+    starts = range(0, len(level), chunksize)
+    chunks = [level[i:i+chunksize] for i in starts]
+    if parents is None:
+        results = pool.map(function, chunks)
+    else:
+        results = pool.map(function, chunks, [parents[i//2:(i+chunksize)//2] for i in starts])
+    return list(chain.from_iterable(results))
+
 def gcd_ext(a: int, b: int) -> tuple:
     '''
     Extended Euclidean algorithm for solving equation
@@ -133,84 +431,256 @@ def inverse_modulo(a: int, m:int):
     ret = (ret%m + m) % m
     return ret
 
-def solve_2_sat(dis: list) -> list:
+def inverse_modulo_many(values, m: int) -> list:
+    '''
+    Compute modular multiplicative inverses of many integers in one modulus m
+    Montgomery's trick: only inverse of product of all values is computed,
+        other inverses are got from prefix products by 3 multiplications for each value
+    Values are taken modulo m, for values without inverse result contains False
+    '''
+    _raise_if_not_positive_integer(m)
+    residues = []
+    for a in values:
+        _raise_if_not_integer(a)
+        residues.append(a % m)
+
+    inverses = _inverse_modulo_trick(residues, m)
+    if inverses is not None:
+        return inverses
+
+    # some values have no inverse, they are skipped in second pass
+    ret = [False] * len(residues)
+    good = [i for i, a in enumerate(residues) if math.gcd(a, m) == 1]
+    for i, inverse in zip(good, _inverse_modulo_trick([residues[i] for i in good], m)):
+        ret[i] = inverse
+    return ret
+
+def _inverse_modulo_trick(residues: list, m: int):
+    '''
+    Internal function: inverses of residues by prefix products
+    If product of residues has no inverse, return None
+    '''
+    # prefix[i] is product of residues before i
+    prefix = [1] * len(residues)
+    product = 1
+    for i, a in enumerate(residues):
+        prefix[i] = product
+        product = product * a % m
+
+    try:
+        inverse = pow(product, -1, m)
+    except ValueError:
+        return None
+
+    # inverse is always inverse of product of residues up to i
+    ret = [0] * len(residues)
+    for i in range(len(residues) - 1, -1, -1):
+        ret[i] = inverse * prefix[i] % m
+        inverse = inverse * residues[i] % m
+    return ret
+
+def solve_2_sat(dis) -> list:
     '''
     Solve problem "2-satisfability", which consist of assigning true/false values to all variables 
         in boolean formula in conjunctive normal form to make formula equal true
     Example of the form: (a || c) && (a || !d) && (b || !d) && (b || !e) && (c || d)
-    Only argument is list of disjunctions (pairs (a, b) which mean that there is (a || b))
+    Only argument is iterable of disjunctions (pairs (a, b) which mean that there is (a || b)),
+        it is read only once, so it can be generator, for example read_dimacs
     For convinience, in input !a shoud be designated by -a, and no "zero" vertex
     As output return false if soluntion doesn't exist, or list of vertices with true value
+    Implication graph is kept in flat arrays and components are found without recursion,
+        so it works for millions of disjunctions
+    '''
+    if np is not None:
+        n, offsets, edges = _implications_numpy(dis)
+    else:
+        n, offsets, edges = _implications(dis)
+    comp = _tarjan(n, offsets, edges)
+
+    # components are numbered in reverse topological order,
+    # so variable is true if it lies after its negation in topological order
+    positive = comp[0::2]
+    negative = comp[1::2]
+    if any(map(eq, positive, negative)):
+        # a and !a lie in same component, so answer doesn't exist
+        return False
+    return list(compress(range(1, n//2 + 1), map(lt, positive, negative)))
+
+def _implications(dis) -> tuple:
+    '''
+    Internal function: implication graph of disjunctions as (n, offsets, edges) in lists,
+        neighbors of v are edges[offsets[v]:offsets[v+1]]
     '''
-    n = 0
-    for a, b in dis:
-        _raise_if_not_integer(a)
-        _raise_if_not_integer(b)
-        n = max(n, max(abs(a), abs(b)))
-    n = n*2 # as we create 2 vertex per variable
-
-    # Adjacency list of future graph
-    edges = [[] for i in range(n)]
-    # Adjacency list of reversed future graph
-    rev_edges = [[] for i in range(n)]
-    
     # edges in graph is this (!a => b) and (!b => a) for disjunction (a, b)
-    for a, b in dis:
-        # more convinient to vertex numbers positive and a^(!a) = 1, ^ is bitwise xor
-        a *= 2
-        if a < 0: 
-            a = -a + 1
-        b *= 2
-        if b < 0: 
-            b = -b + 1
-        a -= 2
-        b -= 2
-        edges[a^1].append(b)
-        edges[b^1].append(a)
-
-        rev_edges[b].append(a^1)
-        rev_edges[a].append(b^1)
-        
-    # list of used vertices
-    was = [False]*n
-    order = list()
-
-    # depth-first search for topological sort
-    def dfs1(v: int):
-        was[v] = True
-        for u in edges[v]:
-            if not was[u]:
-                dfs1(u)
-        order.append(v)
-
-    for v in range(n):
-        if not was[v]:
-            dfs1(v)
-            
-    
-    # number of component where vertex lies
-    comp = [-1]*n
+    # more convinient to vertex numbers positive and a^(!a) = 1, ^ is bitwise xor
+    sources = array('i')
+    targets = array('i')
+    # it is the hottest loop, so arguments are checked by operations themselves
+    add_source = sources.append
+    add_target = targets.append
+    try:
+        for a, b in dis:
+            a = 2*a - 2 if a > 0 else -2*a - 1
+            b = 2*b - 2 if b > 0 else -2*b - 1
+            add_source(a^1)
+            add_target(b)
+            add_source(b^1)
+            add_target(a)
+    except TypeError:
+        raise ValueError("arguments must be integer")
+    if targets and min(targets) < 0:
+        # zero variable is turned into -1
+        raise ValueError("variables must be nonzero integers")
+    n = max(targets, default=-2)
+    n = n + 2 - n%2 # as we create 2 vertex per variable
+
+    offsets, edges = _csr(n, sources, targets)
+    return n, offsets.tolist(), edges.tolist()
+
+def _implications_numpy(dis) -> tuple:
+    '''
+    Internal function: the same as _implications, but variables are only collected in python loop,
+        vertices and adjacency are computed by numpy as in Graph.load_edges
+    '''
+    variables = array('i')
+    add = variables.append
+    try:
+        for a, b in dis:
+            add(a)
+            add(b)
+    except TypeError:
+        raise ValueError("arguments must be integer")
+    x = np.frombuffer(variables, dtype=np.int32).astype(np.int64)
+    if (x == 0).any():
+        raise ValueError("variables must be nonzero integers")
+    x = np.where(x > 0, 2*x - 2, -2*x - 1)
+    n = int(x.max(initial=-2))
+    n = n + 2 - n%2 # as we create 2 vertex per variable
+
+    # for disjunction (a, b) edges (!a => b) and (!b => a) go one after another
+    a, b = x[0::2], x[1::2]
+    sources = np.stack((a^1, b^1), axis=1).ravel()
+    targets = np.stack((b, a), axis=1).ravel()
+    # stable sort keeps order of edges of every vertex
+    edges = targets[np.argsort(sources, kind="stable")]
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(sources, minlength=n))))
+    return n, offsets.tolist(), edges.tolist()
 
-    # depth-first search for finding strongly connected components
-    def dfs2(v: int, cp: int):
-        comp[v] = cp
-        for u in rev_edges[v]:
-            if comp[u] == -1:
-                # vertex wasn't visited
-                dfs2(u, cp)
+def _csr(n: int, sources: array, targets: array) -> tuple:
+    '''
+    Internal function: compact adjacency of graph with n vertices from arrays of edges,
+        neighbors of v are edges[offsets[v]:offsets[v+1]]
+    '''
+    # degree[v+1] - number of edges from v, so prefix sums are offsets
+    degree = array('i', bytes(4 * (n+1)))
+    for v in sources:
+        degree[v+1] += 1
+    offsets = array('i', accumulate(degree))
+    position = offsets[:-1]
+    edges = array('i', bytes(4 * len(targets)))
+    for v, u in zip(sources, targets):
+        edges[position[v]] = u
+        position[v] += 1
+    return offsets, edges
 
+def _tarjan(n: int, offsets: list, edges: list) -> list:
+    '''
+    Internal function: strongly connected components by Tarjan's algorithm without recursion
+    Return list comp, components are numbered from 1 in reverse topological order
+    Lists are used instead of arrays, as reading from them doesn't create new int objects
+    '''
+    # index[v] - time when v was visited, 0 if it wasn't
+    # low[v] - minimal index reachable from subtree of v by vertices on stack
+    index = [0] * n
+    low = [0] * n
+    comp = [0] * n
+    # position of next neighbor to look at for every vertex
+    position = offsets[:-1]
+    # vertex is on stack if it was visited and its component isn't known yet
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    time = 1
     comp_number = 0
-    for v in order[::-1]:
-        if comp[v] == -1:
-            comp_number += 1
-            dfs2(v, comp_number)
-
-    ret = list()
-    for v in range(n):
-        if comp[v] == comp[v^1]:
-            # a and !a lie in same component, so answer doesn't exist
-            return False
-        if comp[v] > comp[v^1] and v < v^1:
-            ret.append(v//2+1)
 
-    return ret
+    for start in range(n):
+        if index[start]:
+            continue
+        index[start] = low[start] = time
+        time += 1
+        push(start)
+        path = [start]
+        go_down = path.append
+        go_up = path.pop
+        while path:
+            v = path[-1]
+            i = position[v]
+            end = offsets[v+1]
+            # low of v is kept in local variable while its neighbors are looked at
+            low_v = low[v]
+            while i < end:
+                u = edges[i]
+                i += 1
+                index_u = index[u]
+                if not index_u:
+                    position[v] = i
+                    low[v] = low_v
+                    index[u] = low[u] = time
+                    time += 1
+                    push(u)
+                    go_down(u)
+                    break
+                if index_u < low_v and not comp[u]:
+                    low_v = index_u
+            else:
+                go_up()
+                low[v] = low_v
+                if path and low_v < low[path[-1]]:
+                    low[path[-1]] = low_v
+                if low_v == index[v]:
+                    # v is root of component, all vertices above it on stack belong to it
+                    comp_number += 1
+                    while True:
+                        u = pop()
+                        comp[u] = comp_number
+                        if u == v:
+                            break
+    return comp
+
+def read_dimacs(path: str):
+    '''
+    Generator of disjunctions from file in DIMACS CNF format, file is read line by line
+    Disjunction of one variable (a) is returned as (a, a)
+    If disjunction has more than 2 variables, raise exception as it isn't 2-SAT problem
+    Empty disjunction (single 0) can't be satisfied and can't be passed as pair,
+        so exception is raised for it too
+    '''
+    clause = []
+    with open(path) as file:
+        for line in file:
+            tokens = line.split()
+            if not tokens or tokens[0][0] in "cp":
+                # comment or problem line
+                continue
+            if tokens[0][0] == "%":
+                # end of file in some benchmarks
+                break
+            if len(tokens) == 3 and tokens[2] == "0" and "0" not in tokens[:2] and not clause:
+                # usual line "a b 0" with whole disjunction
+                yield (int(tokens[0]), int(tokens[1]))
+                continue
+            for x in map(int, tokens):
+                if x != 0:
+                    clause.append(x)
+                    continue
+                if len(clause) > 2:
+                    raise ValueError("disjunction has more than 2 variables")
+                if not clause:
+                    raise ValueError("empty disjunction, formula can't be satisfied")
+                yield (clause[0], clause[-1])
+                clause = []
+    if len(clause) > 2:
+        raise ValueError("disjunction has more than 2 variables")
+    if clause:
+        # last disjunction without 0 at the end
+        yield (clause[0], clause[-1])
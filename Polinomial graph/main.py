@@ -1,231 +1,107 @@
-import tkinter as tk
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
-def parser(text):
-    if not text:
-        return None
-
-    for c in text:
-        if c not in Polynomial.POSSIBLE_SUMBOLS:
-            return None
-    terms = []
-    current = ""
-    for c in text:
-        if c == "+" or c == "-":
-            if current:
-                terms.append(current)
-            current = c
-        else:
-            current += c
-    if current:
-        terms.append(current)
-    
-    new_coef = [0.] * Polynomial.MAX_LENGTH
-    for term in terms:
-        if 'x' in term:
-            # accept term only of type 'coefficient'*x^'power'
-            try:
-                c, p = term.split('x')
-            except ValueError:
-                return None
-            
-            if not c or c == '+':
-                coefficient = 1.
-            elif c == '-':
-                coefficient = -1.
-            else:
-                if (c[-1] == '*'):
-                    c = c[:-1]
-                try:
-                    coefficient = float(c)
-                except ValueError:
-                    return None
-                    
-            if not p:
-                power = 1
-            else:
-                try:
-                    power = int(p[1:])
-                except ValueError:
-                    return None
-
-            if power >= Polynomial.MAX_LENGTH:
-                # cannot have such power in our polinomial
-                return 
-            new_coef[power] += coefficient
+from polynomial import Polynomial, parser, adaptive_samples, fit_ylim
+
+def _analyze_chunk(lines: list) -> list:
+    '''
+    Worker of batch analysis: parse chunk of lines and return info of every polinomial
+    Roots of derivatives in chunk are found by one batched call
+    Error in one line gives error row for it, other lines are analyzed as usual
+    '''
+    functions = []
+    for line in lines:
+        try:
+            functions.append(parser(line))
+        except Exception:
+            functions.append(None)
+    derivs = [f.get_derivative() for f in functions if f is not None]
+    try:
+        Polynomial.get_zero_points_many(derivs + [d.get_derivative() for d in derivs])
+    except Exception:
+        # roots will be found one by one in get_info, where error is caught for its line
+        pass
+
+    ret = []
+    for line, f in zip(lines, functions):
+        info = {"Input": line}
+        if f is None:
+            info["Polinomial"] = "Wrong input"
         else:
-            # free coefficient
             try:
-                new_coef[0] += float(term)
-            except ValueError:
-                return None
-    return Polynomial(new_coef)
-
-class Polynomial:
-    MAX_LENGTH = 4 # a*x^0 + b*x^1 + c*x^2 + d*x^3
-    POSSIBLE_SUMBOLS = "0123456789.*/+-x^"
-
-    def __init__(self, coef=[]):
-        self.coef = coef
-        if not coef:
-            self.reset()
-    
-    def reset(self):
-        # clear list of coefficients
-        self.coef = [0.] * Polynomial.MAX_LENGTH
-
-    def is_zero(x: float):
-        return abs(x) < 0.000001
-        
-    def sign(x):
-        if x > 0:
-            return 1
-        return -1
-
-    def to_str(self):
-        ret = ""
-        x = ""
-        for p, c in enumerate(self.coef):
-            # p - power, c - coefficient
-            if isinstance(c, str):
-                ret += c # case of 'C' in integral
-            elif not Polynomial.is_zero(c):
-                ret += f"{c:+.3f}{x}"
-            if not p:
-                x = '*x'
-            else:
-                x = f"*x^{p+1}"
-
-        if ret and ret[0] == '+':
-            ret = ret[1:]
-        if not ret:
-            ret = "0"
-        return ret
-        
-    def get_power(self):
-        ret = 0
-        for i, coef in enumerate(self.coef):
-            if not Polynomial.is_zero(coef):
-                ret = i
-        return ret
-
-    def get_zero_points(self):
-        ret = list()
-        p = self.get_power()
-        if p == 1:
-            ret = [-self.coef[0] / self.coef[1]]
-        elif p == 2:
-            a = self.coef[2]
-            b = self.coef[1]
-            c = self.coef[0]
-            D = b*b - 4*a*c
-            if Polynomial.is_zero(D):
-                ret = [-b/(2*a)]
-            elif D > 0:
-                ret = [(-b + D**0.5)/(2*a),
-                       (-b - D**0.5)/(2*a)]
-        return ret
-
-    def get_at_point(self, x):
-        ret = 0.
-        p = 1.
-        for coef in self.coef:
-            ret += coef*p
-            p *= x
-        return ret
-
-    def get_y(self, lin):
-        if isinstance(lin, (float, int)):
-            # get at one point
-            return self.get_at_point(lin)
-        # get at many points
-        return [self.get_at_point(y) for y in lin]
-
-    def get_derivative(self):
-        deriv = Polynomial([self.coef[i]*i for i in range(1, len(self.coef))])
-        return deriv
-
-    def get_integral(self):
-        integral = Polynomial(["C"] + [self.coef[i]/(i+1) for i in range(len(self.coef))])
-        return integral
-
-    def get_intervals(self):
-        # return [ascending_intervals, descending_intervals]
-        asc = []
-        desc = []
-        deriv = self.get_derivative()
-        if deriv.get_power() == 0:
-            if deriv.coef[0] > 0:
-                asc.append([float("-INF"), float("+INF")])
-            else:
-                desc.append([float("-INF"), float("+INF")])
-
-        elif deriv.get_power() > 0:
-            crit_points = deriv.get_zero_points()
-            intervals = [float("-INF")] + crit_points + [float("INF")]
-            for i in range(len(intervals)-1):
-                l = intervals[i]
-                r = intervals[i+1]
-                sign = 1
-                if l == float("-INF") and r == float("INF"):
-                    sign = Polynomial.sign(deriv.get_y(0))
-                elif l == float("-INF"):
-                    sign = Polynomial.sign(deriv.get_y(2*r-10))
-                elif r == float("INF"):
-                    sign = Polynomial.sign(deriv.get_y(2*l+10))
-                else:
-                    sign = Polynomial.sign(deriv.get_y((l+r)/2))
-                
-                if sign == 1:
-                    asc.append((l, r))
-                else:
-                    desc.append((l, r))
-        return [asc, desc]
-
-    def get_info(self):
-        ret = dict()
-        for s in ("Polinomial", "Derivative", "Integral", "Critical points", "Ascending intervals", "Descending intervals", "Convex intervals", "Concave intervals"):
-            ret[s] = "No"
-
-        ret["Polinomial"] = self.to_str()
-        ret["Integral"] = self.get_integral().to_str()
-
-        deriv = self.get_derivative()
-        ret["Derivative"] = deriv.to_str()
-        crit_points = deriv.get_zero_points()
-
-        if crit_points:
-            ret["Critical points"] = ", ".join(f"{i:.3f}" for i in crit_points)
-
-        if self.get_power() > 0:
-            asc, desc = self.get_intervals()
-            intervals_to_str = lambda cur: ", ".join(f"({l:.3f}, {r:.3f})" for l, r in cur)
-            if asc:
-                ret["Ascending intervals"] = intervals_to_str(asc)
-            if desc:
-                ret["Descending intervals"] = intervals_to_str(desc)
-            if self.get_power() > 1:
-                convex, concave = deriv.get_intervals()
-                if convex:
-                    ret["Convex intervals"] = intervals_to_str(convex)
-                if concave:
-                    ret["Concave intervals"] = intervals_to_str(concave)
-        return ret
-
+                info.update(f.get_info())
+            except Exception as e:
+                info = {"Input": line, "Polinomial": "Error: %s" % e}
+        ret.append(info)
+    return ret
+
+def analyze_stream(lines, workers=None, chunksize=1000):
+    '''
+    Lazily yield info of every polinomial from iterable of lines, in input order
+    Lines are read chunk by chunk and analyzed by pool of processes,
+        only limited number of chunks is in memory at once
+    '''
+    workers = workers or os.cpu_count() or 1
+    lines = (line.strip() for line in lines)
+    lines = (line for line in lines if line)
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        while True:
+            chunk = list(islice(lines, chunksize))
+            if not chunk:
+                break
+            pending.append(pool.submit(_analyze_chunk, chunk))
+            if len(pending) >= 2*workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def batch_analysis(src, dst, fmt="jsonl", workers=None, chunksize=1000) -> None:
+    '''
+    Headless mode: read polinomials from src (one per line) and write their info to dst
+    fmt is "jsonl" or "csv"
+    '''
+    if fmt == "csv":
+        writer = csv.DictWriter(dst, fieldnames=("Input",) + Polynomial.INFO_NAMES)
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        write = lambda info: dst.write(json.dumps(info) + "\n")
+
+    for info in analyze_stream(src, workers, chunksize):
+        write(info)
 
 
 class Main():
     FONT = ("Arial", 12)
     INFO_NAMES = ("Derivative", "Integral", "Critical points", "Ascending intervals", "Descending intervals", "Convex intervals", "Concave intervals")
+    DEBOUNCE = 200 # milliseconds from last keystroke to computation
+    POLL = 20 # milliseconds between checks of computation result
 
     def __init__(self):
-        
+        # window needs Tk, it is imported only here so batch mode works without it
+        import tkinter as tk
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
         self.function = None
 
+        # parsing, analysis and sampling run in worker thread, see update
+        self.worker = ThreadPoolExecutor(max_workers=1)
+        self.task = None
+        self.generation = 0
+        self.after_input = None
+
         window = tk.Tk()
         window.title("Endterm")
+        self.window = window
 
         frm_graph = tk.Frame()
         self.plt_fig = Figure(figsize=(6.5, 5), dpi=100)
@@ -233,6 +109,7 @@ class Main():
         self.plt_toolbar = NavigationToolbar2Tk(self.plt_canvas, frm_graph)
         self.plt_toolbar.update()
         self.plt_canvas.get_tk_widget().pack()
+        self.init_plot()
 
         # Naming rules
         # lbl = Label
@@ -242,11 +119,13 @@ class Main():
 
         frm_input = tk.Frame(padx=5, pady=5)
 
-        lbl_help = tk.Label(master=frm_input, text="Accept only polinomials up to third power of the form:\n sum of 'coefficient'*x^'power'", font=Main.FONT, bg="gainsboro", width=60, height=2)
+        lbl_help = tk.Label(master=frm_input, text="Accept only polinomials of the form:\n sum of 'coefficient'*x^'power'", font=Main.FONT, bg="gainsboro", width=60, height=2)
         lbl_help.grid(column=0, row=0, padx=5, pady=5, columnspan=3)
 
         self.ent_input = tk.Entry(master=frm_input, bg="gainsboro", width=30, font=Main.FONT)
         self.ent_input.grid(column=0, row=1, padx=5, pady=5)
+        # graph is updated while typing
+        self.ent_input.bind("<KeyRelease>", self.on_key)
                     
 
         self.btn_input = tk.Button(master=frm_input, text="Enter", font=Main.FONT, bg="gainsboro", width=10, command=self.update)
@@ -271,40 +150,133 @@ class Main():
         frm_info.grid(column=1, row=0)
 
         window.mainloop()
-
-    def display(self, xlim=(-100, 100)):
-        self.plt_fig.clf()
-        if self.function == None:
+        self.worker.shutdown(wait=False, cancel_futures=True)
+
+    def init_plot(self):
+        '''
+        Create axes and line once, later only data of line is replaced
+        Line is animated: it is not part of cached background and drawn over it by blitting
+        '''
+        self.plt_axes = self.plt_fig.add_subplot(111)
+        self.plt_axes.set_xlabel("X")
+        self.plt_axes.set_ylabel("Y")
+        self.plt_line, = self.plt_axes.plot([], [], color="black", linewidth=2, animated=True)
+        self.plt_background = None
+
+        # zoom and pan of toolbar change limits, curve is sampled again for visible range
+        self.plt_axes.callbacks.connect("xlim_changed", self.resample)
+        # every full draw (limits changed, window resized) updates cached background
+        self.plt_canvas.mpl_connect("draw_event", self.on_draw)
+
+    def on_draw(self, event):
+        if event.canvas is not self.plt_canvas or event.canvas.is_saving():
+            # animated line is skipped by savefig of toolbar, so it is drawn here
+            self.plt_line.draw(event.renderer)
             return
-        subplot = self.plt_fig.add_subplot(111)
-        subplot.set_xlim(xlim)
-        subplot.set_xlabel("X")
-        subplot.set_ylabel("Y")
-
-        X = [i/10 for i in range(xlim[0]*10, xlim[1]*10)]
-        Y = self.function.get_y(X)
-        subplot.plot(X, Y, color="black", linewidth=2)
+        self.plt_background = self.plt_canvas.copy_from_bbox(self.plt_axes.bbox)
+        self.plt_axes.draw_artist(self.plt_line)
+        self.plt_canvas.blit(self.plt_axes.bbox)
+
+    def redraw(self, full=False):
+        if full or self.plt_background is None:
+            # on_draw will draw line after axes
+            self.plt_canvas.draw()
+            return
+        self.plt_canvas.restore_region(self.plt_background)
+        self.plt_axes.draw_artist(self.plt_line)
+        self.plt_canvas.blit(self.plt_axes.bbox)
+
+    def display(self, X, Y, xlim, ylim):
+        self.plt_line.set_data(X, Y)
+
+        # background is reused only if limits are the same
+        subplot = self.plt_axes
+        full = tuple(subplot.get_xlim()) != tuple(xlim) or tuple(subplot.get_ylim()) != tuple(ylim)
+        subplot.set_xlim(xlim, emit=False)
+        subplot.set_ylim(ylim, emit=False)
+        self.redraw(full)
+
+    def resample(self, subplot):
+        if self.function is None:
+            # nothing is plotted yet
+            return
+        ylim = subplot.get_ylim()
+        X, Y = adaptive_samples(self.function, subplot.get_xlim(), subplot.bbox.width, subplot.bbox.height, ylim[1] - ylim[0])
+        self.plt_line.set_data(X, Y)
+        self.plt_canvas.draw_idle()
+
+    def compute(text, xlim, width, height, is_stale):
+        '''
+        Work of worker thread, does not touch widgets
+        Return (function, info, X, Y, ylim) or None if input is wrong or newer input appeared
+        '''
+        function = parser(text)
+        if function == None or is_stale():
+            return None
+        info = function.get_info()
+        if is_stale():
+            return None
+        X, Y = adaptive_samples(function, xlim, width, height)
+        return function, info, X, Y, fit_ylim(Y)
 
-        self.plt_canvas.draw()
+    def on_key(self, event):
+        # debounce: computation starts only when user stops typing
+        if self.after_input is not None:
+            self.window.after_cancel(self.after_input)
+        self.after_input = self.window.after(Main.DEBOUNCE, self.update)
 
-    def update(self):
+    def update(self, xlim=(-100, 100)):
+        self.after_input = None
         text = self.ent_input.get()
-        self.function = parser(text)
-        if self.function == None:
-            return
 
-        for name, info in self.lbls_info:
-            info["text"] = ''
-        self.lbl_input["text"] = "Wrong input"
+        # every input gets new generation, computations of older ones are stale
+        self.generation += 1
+        generation = self.generation
+        if self.task is not None:
+            # drop computation if it hasn't started yet
+            self.task.cancel()
+        is_stale = lambda: generation != self.generation
+
+        width, height = self.plt_axes.bbox.width, self.plt_axes.bbox.height
+        self.task = self.worker.submit(Main.compute, text, xlim, width, height, is_stale)
+        self.window.after(Main.POLL, self.poll, self.task, xlim)
+
+    def poll(self, task, xlim):
+        '''
+        Check result of worker in Tk thread, results are applied to widgets only here
+        '''
+        if task is not self.task:
+            # newer input was entered
+            return
+        if not task.done():
+            self.window.after(Main.POLL, self.poll, task, xlim)
+            return
+        self.task = None
+        result = task.result()
+        if result == None:
+            return
+        self.function, info, X, Y, ylim = result
 
-        if self.function != None:
-            info = self.function.get_info()
-            self.lbl_input["text"] = info["Polinomial"]
-            for i, name in enumerate(Main.INFO_NAMES):
-                # update information about function
-                self.lbls_info[i][1]["text"] = info.get(name, '')
+        self.lbl_input["text"] = info["Polinomial"]
+        for i, name in enumerate(Main.INFO_NAMES):
+            # update information about function
+            self.lbls_info[i][1]["text"] = info.get(name, '')
 
-        self.display()
+        self.display(X, Y, xlim, ylim)
 
 if __name__ == "__main__":
-    Main()  
+    arg_parser = argparse.ArgumentParser(description="Graphs of polinomials. Without --batch opens window")
+    arg_parser.add_argument("--batch", metavar="FILE", help="analyze polinomials from FILE, one per line ('-' for stdin) without window")
+    arg_parser.add_argument("--output", metavar="FILE", help="file for results of --batch, stdout by default")
+    arg_parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    arg_parser.add_argument("--workers", type=int, default=None, help="number of processes, all cores by default")
+    arg_parser.add_argument("--chunksize", type=int, default=1000, help="number of polinomials sent to process at once")
+    args = arg_parser.parse_args()
+
+    if args.batch is None:
+        Main()
+    else:
+        src = sys.stdin if args.batch == "-" else open(args.batch)
+        dst = sys.stdout if args.output is None else open(args.output, "w", newline="")
+        with src, dst:
+            batch_analysis(src, dst, args.format, args.workers, args.chunksize)  
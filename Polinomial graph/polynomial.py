@@ -0,0 +1,464 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+
+
+# one term of polinomial: 'coefficient'*x^'power' or free coefficient, sign is separator of terms
+_TERM = re.compile(r"""
+    ([+-]?)
+    (?:
+        (?:(\d+\.?\d*|\.\d+)\*?)?x(?:\^(\d+))?
+      | (\d+\.?\d*|\.\d+)
+    )""", re.VERBOSE)
+
+# whitespaces around signs of terms, they are removed before parsing
+_SIGN_SPACES = re.compile(r"\s*([+-])\s*")
+
+def parser(text):
+    if not text:
+        return None
+    # whitespaces around terms are ignored, so equal polinomials share one cache entry
+    # other whitespaces (inside numbers or terms) are left, and such input is wrong
+    return _parse(_SIGN_SPACES.sub(r"\1", text.strip()))
+
+@lru_cache(maxsize=1024)
+def _parse(text):
+    '''
+    Parse text in one pass by matching terms one after another
+    Result is cached, Polynomial is immutable so it can be shared
+    '''
+    if not text:
+        return None
+
+    coef = dict()
+    pos = 0
+    while pos < len(text):
+        match = _TERM.match(text, pos)
+        if not match or (pos and not match[1]):
+            # unknown symbols or terms not separated by sign
+            return None
+        sign, c, p, free = match.groups()
+        pos = match.end()
+
+        if free is not None:
+            power = 0
+            coefficient = float(free)
+        else:
+            power = int(p) if p else 1
+            coefficient = float(c) if c else 1.
+        if sign == '-':
+            coefficient = -coefficient
+        coef[power] = coef.get(power, 0.) + coefficient
+
+    new_coef = [0.] * (max(coef) + 1)
+    for power, coefficient in coef.items():
+        new_coef[power] = coefficient
+    return Polynomial(new_coef)
+
+def _multiply(a, b):
+    '''
+    Product of polinomials given by arrays of coefficients
+    Short ones are multiplied by schoolbook method (np.convolve), long ones by FFT
+    '''
+    if min(len(a), len(b)) <= Polynomial.FFT_LENGTH:
+        return np.convolve(a, b)
+    size = len(a) + len(b) - 1
+    n = 1 << (size - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(a, n) * np.fft.rfft(b, n), n)[:size]
+
+def _cached(method):
+    '''
+    Decorator for Polynomial methods without arguments: result is computed
+        on first call and stored in instance cache
+    Polynomial is immutable, so cached result never becomes outdated
+    '''
+    name = method.__name__
+    def wrapper(self):
+        if name not in self._cache:
+            self._cache[name] = method(self)
+        return self._cache[name]
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+class Polynomial:
+    FFT_LENGTH = 512 # longer polinomials are multiplied by FFT
+    INFO_NAMES = ("Polinomial", "Derivative", "Integral", "Critical points", "Ascending intervals", "Descending intervals", "Convex intervals", "Concave intervals")
+    __slots__ = ("coef", "_cache")
+
+    def __init__(self, coef=()):
+        # tuple of coefficients, coef[i] is coefficient of x^i
+        coef = tuple(coef)
+        object.__setattr__(self, "coef", coef if coef else (0.,))
+        # results of derivative, roots, intervals, etc., filled lazily
+        object.__setattr__(self, "_cache", dict())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Polynomial is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return self.coef == other.coef
+
+    def __hash__(self):
+        return hash(self.coef)
+
+    def __reduce__(self):
+        # default pickling sets slots by assignment, which is forbidden
+        return (Polynomial, (self.coef,))
+
+    def from_array(coef):
+        # Polynomial from array of coefficients without trailing zeros
+        coef = np.trim_zeros(np.asarray(coef, dtype=float), "b")
+        return Polynomial(coef.tolist())
+
+    def _to_array(other):
+        # coefficients of polinomial or number as array, None for other types
+        if isinstance(other, Polynomial):
+            return np.array(other.coef, dtype=float)
+        if isinstance(other, (int, float)):
+            return np.array([other], dtype=float)
+        return None
+
+    def __add__(self, other):
+        b = Polynomial._to_array(other)
+        if b is None:
+            return NotImplemented
+        a = Polynomial._to_array(self)
+        ret = np.zeros(max(len(a), len(b)))
+        ret[:len(a)] += a
+        ret[:len(b)] += b
+        return Polynomial.from_array(ret)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Polynomial([-c for c in self.coef])
+
+    def __sub__(self, other):
+        if Polynomial._to_array(other) is None:
+            return NotImplemented
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        b = Polynomial._to_array(other)
+        if b is None:
+            return NotImplemented
+        return Polynomial.from_array(_multiply(Polynomial._to_array(self), b))
+
+    __rmul__ = __mul__
+
+    def product(polynomials):
+        '''
+        Product of many polinomials, multiplied pairwise as balanced tree,
+            so long polinomials are multiplied by fast methods
+        '''
+        arrays = [Polynomial._to_array(p) for p in polynomials] or [np.ones(1)]
+        while len(arrays) > 1:
+            arrays = [_multiply(arrays[i], arrays[i+1]) if i+1 < len(arrays) else arrays[i]
+                      for i in range(0, len(arrays), 2)]
+        return Polynomial.from_array(arrays[0])
+
+    def __pow__(self, n):
+        if not isinstance(n, int) or n < 0:
+            return NotImplemented
+        # binary exponentiation
+        ret = Polynomial([1.])
+        cur = self
+        while n:
+            if n & 1:
+                ret = ret * cur
+            n >>= 1
+            if n:
+                cur = cur * cur
+        return ret
+
+    def __divmod__(self, other):
+        b = Polynomial._to_array(other)
+        if b is None:
+            return NotImplemented
+        m = Polynomial.from_array(b).get_power()
+        if m == 0 and Polynomial.is_zero(b[0]):
+            raise ZeroDivisionError("division by zero polinomial")
+        b = b[:m+1]
+
+        # long division, rem[i+m] is eliminated on every step
+        rem = Polynomial._to_array(self)
+        quot = np.zeros(max(len(rem) - m, 1))
+        for i in range(len(rem) - m - 1, -1, -1):
+            quot[i] = rem[i+m] / b[m]
+            rem[i:i+m+1] -= quot[i] * b
+        return Polynomial.from_array(quot), Polynomial.from_array(rem[:m])
+
+    def __floordiv__(self, other):
+        ret = self.__divmod__(other)
+        return ret if ret is NotImplemented else ret[0]
+
+    def __mod__(self, other):
+        ret = self.__divmod__(other)
+        return ret if ret is NotImplemented else ret[1]
+
+    def __call__(self, other):
+        '''
+        Composition self(other) if other is Polynomial, otherwise value in point(s)
+        '''
+        if not isinstance(other, Polynomial):
+            return self.get_y(other)
+        # Horner's scheme with polinomials instead of numbers
+        ret = Polynomial([0.])
+        for coef in reversed(self.coef):
+            ret = ret * other + coef
+        return ret
+
+    def is_zero(x: float):
+        return abs(x) < 0.000001
+
+    def is_real_root(z: complex):
+        # eigenvalues of multiple real roots get small imaginary part, so tolerance is relative
+        return abs(z.imag) < 0.00001 * (1 + abs(z))
+
+    def is_numerical_root(coef, x: float):
+        # value in x is zero up to rounding errors of computing it by Horner's scheme
+        value = 0.
+        scale = 0.
+        for c in reversed(coef):
+            value = value*x + c
+            scale = scale*abs(x) + abs(c)
+        return abs(value) <= 1e-12 * scale
+        
+    def sign(x):
+        if x > 0:
+            return 1
+        return -1
+
+    def to_str(self):
+        ret = ""
+        x = ""
+        for p, c in enumerate(self.coef):
+            # p - power, c - coefficient
+            if isinstance(c, str):
+                ret += c # case of 'C' in integral
+            elif not Polynomial.is_zero(c):
+                ret += f"{c:+.3f}{x}"
+            if not p:
+                x = '*x'
+            else:
+                x = f"*x^{p+1}"
+
+        if ret and ret[0] == '+':
+            ret = ret[1:]
+        if not ret:
+            ret = "0"
+        return ret
+        
+    @_cached
+    def get_power(self):
+        ret = 0
+        for i, coef in enumerate(self.coef):
+            if not Polynomial.is_zero(coef):
+                ret = i
+        return ret
+
+    def get_zero_points(self):
+        if "get_zero_points" not in self._cache:
+            Polynomial.get_zero_points_many([self])
+        return self._cache["get_zero_points"]
+
+    def get_zero_points_many(polynomials) -> list:
+        '''
+        Real roots of many polinomials at once, sorted in ascending order
+        Roots are eigenvalues of companion matrix, matrices of polinomials
+            with same power are solved by one vectorized call
+        Roots are cached in every polinomial, already solved ones are skipped
+        '''
+        ret = [[] for _ in polynomials]
+        groups = dict()
+        for i, poly in enumerate(polynomials):
+            if "get_zero_points" in poly._cache:
+                ret[i] = poly._cache["get_zero_points"]
+                continue
+            p = poly.get_power()
+            if p > 0:
+                groups.setdefault(p, []).append(i)
+
+        for p, ids in groups.items():
+            coef = np.array([polynomials[i].coef[:p+1] for i in ids], dtype=float)
+            with np.errstate(all="ignore"):
+                last = -coef[:, :p] / coef[:, p:]
+            # polinomials with infinite or nan coefficients (or their ratios) have no real roots
+            finite = np.isfinite(last).all(axis=1)
+            ids = [i for i, ok in zip(ids, finite) if ok]
+            last = last[finite]
+            if not ids:
+                continue
+            if p == 1:
+                roots = last.astype(complex)
+            else:
+                # companion matrix of x^p + (c[p-1]/c[p])*x^(p-1) + ... + c[0]/c[p]
+                companion = np.zeros((len(ids), p, p))
+                companion[:, np.arange(1, p), np.arange(p-1)] = 1.
+                companion[:, :, -1] = last
+                roots = np.linalg.eigvals(companion)
+
+            for i, cur in zip(ids, roots):
+                coef = polynomials[i].coef[:p+1]
+                # root of multiplicity k is found as k eigenvalues around it at distance about eps^(1/k),
+                # their real parts are accepted if polinomial is zero there up to rounding
+                real = sorted(float(z.real) for z in cur
+                              if Polynomial.is_real_root(z) or Polynomial.is_numerical_root(coef, z.real))
+                # neighbours are one root if polinomial is zero between them too,
+                # mean of group is precise as eigenvalues are symmetric around root
+                groups = []
+                for x in real:
+                    if groups and Polynomial.is_numerical_root(coef, (groups[-1][-1] + x) / 2):
+                        groups[-1].append(x)
+                    else:
+                        groups.append([x])
+                ret[i] = [sum(group) / len(group) for group in groups]
+
+        for i, poly in enumerate(polynomials):
+            ret[i] = tuple(ret[i])
+            poly._cache["get_zero_points"] = ret[i]
+        return ret
+
+    def get_at_point(self, x):
+        # Horner's scheme: (((d)*x + c)*x + b)*x + a
+        ret = 0.
+        for coef in reversed(self.coef):
+            ret = ret*x + coef
+        return ret
+
+    def get_y(self, lin):
+        if np.ndim(lin) == 0:
+            # get at one point
+            return self.get_at_point(lin)
+        # get at many points, Horner's scheme over whole array in place
+        X = np.asarray(lin, dtype=float)
+        Y = np.zeros_like(X)
+        for coef in reversed(self.coef):
+            Y *= X
+            Y += coef
+        return Y
+
+    @_cached
+    def get_derivative(self):
+        deriv = Polynomial([self.coef[i]*i for i in range(1, len(self.coef))])
+        return deriv
+
+    @_cached
+    def get_integral(self):
+        integral = Polynomial(("C",) + tuple(self.coef[i]/(i+1) for i in range(len(self.coef))))
+        return integral
+
+    @_cached
+    def get_intervals(self):
+        # return (ascending_intervals, descending_intervals)
+        asc = []
+        desc = []
+        deriv = self.get_derivative()
+        if deriv.get_power() == 0:
+            if deriv.coef[0] > 0:
+                asc.append((float("-INF"), float("+INF")))
+            else:
+                desc.append((float("-INF"), float("+INF")))
+
+        elif deriv.get_power() > 0:
+            crit_points = deriv.get_zero_points()
+            intervals = (float("-INF"),) + crit_points + (float("INF"),)
+            for i in range(len(intervals)-1):
+                l = intervals[i]
+                r = intervals[i+1]
+                sign = 1
+                if l == float("-INF") and r == float("INF"):
+                    sign = Polynomial.sign(deriv.get_y(0))
+                elif l == float("-INF"):
+                    sign = Polynomial.sign(deriv.get_y(2*r-10))
+                elif r == float("INF"):
+                    sign = Polynomial.sign(deriv.get_y(2*l+10))
+                else:
+                    sign = Polynomial.sign(deriv.get_y((l+r)/2))
+                
+                if sign == 1:
+                    asc.append((l, r))
+                else:
+                    desc.append((l, r))
+        return (tuple(asc), tuple(desc))
+
+    def get_info(self):
+        # cached dict is shared by all users of this polinomial, so everyone gets own copy
+        return dict(self._get_info())
+
+    @_cached
+    def _get_info(self):
+        ret = dict()
+        for s in Polynomial.INFO_NAMES:
+            ret[s] = "No"
+
+        ret["Polinomial"] = self.to_str()
+        ret["Integral"] = self.get_integral().to_str()
+
+        deriv = self.get_derivative()
+        ret["Derivative"] = deriv.to_str()
+        crit_points = deriv.get_zero_points()
+
+        if crit_points:
+            ret["Critical points"] = ", ".join(f"{i:.3f}" for i in crit_points)
+
+        if self.get_power() > 0:
+            asc, desc = self.get_intervals()
+            intervals_to_str = lambda cur: ", ".join(f"({l:.3f}, {r:.3f})" for l, r in cur)
+            if asc:
+                ret["Ascending intervals"] = intervals_to_str(asc)
+            if desc:
+                ret["Descending intervals"] = intervals_to_str(desc)
+            if self.get_power() > 1:
+                convex, concave = deriv.get_intervals()
+                if convex:
+                    ret["Convex intervals"] = intervals_to_str(convex)
+                if concave:
+                    ret["Concave intervals"] = intervals_to_str(concave)
+        return ret
+
+
+def adaptive_samples(function, xlim, width, height, yspan=None, max_per_pixel=4, tolerance=0.25):
+    '''
+    Return arrays X, Y of points for drawing function on xlim in plot of width x height pixels
+    Initially there is one point per pixel, segments where curve deviates from
+        straight line more than tolerance pixels are split, up to max_per_pixel points per pixel
+    yspan - visible range of y, if None range of sampled values is used
+    '''
+    width = max(int(width), 2)
+    X = np.linspace(xlim[0], xlim[1], width + 1)
+    Y = function.get_y(X)
+    if yspan is None:
+        yspan = np.ptp(Y)
+    if not np.isfinite(yspan) or Polynomial.is_zero(yspan) or not np.isfinite(Y).all():
+        return X, Y
+
+    # deviation from straight line in pixels near every inner point
+    bend = np.abs(Y[:-2] - 2*Y[1:-1] + Y[2:]) * (height / yspan)
+    bend = np.maximum(np.r_[bend[:1], bend], np.r_[bend, bend[-1:]])
+    # deviation decreases as square of number of parts
+    parts = np.clip(np.ceil(np.sqrt(bend / tolerance)), 1, max_per_pixel).astype(int)
+    if (parts == 1).all():
+        return X, Y
+
+    # every segment [X[i], X[i+1]] is split into parts[i] equal parts
+    step = np.repeat((X[1:] - X[:-1]) / parts, parts)
+    index = np.arange(parts.sum()) - np.repeat(np.cumsum(parts) - parts, parts)
+    X = np.append(np.repeat(X[:-1], parts) + index*step, X[-1])
+    return X, function.get_y(X)
+
+def fit_ylim(Y):
+    '''
+    Limits of y axis which fit sampled values with margins, as autoscale of matplotlib
+    '''
+    finite = Y[np.isfinite(Y)]
+    ymin, ymax = (finite.min(), finite.max()) if len(finite) else (-1., 1.)
+    margin = (ymax - ymin) * 0.05 if not Polynomial.is_zero(ymax - ymin) else 1.
+    return (ymin - margin, ymax + margin)
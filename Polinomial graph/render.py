@@ -0,0 +1,79 @@
+'''
+Offscreen rendering of graphs of polinomials into image files (png, svg, etc.)
+Uses only Agg backend of matplotlib, so it works without display and tkinter
+'''
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from polynomial import parser, adaptive_samples, fit_ylim
+
+FIGSIZE = (6.5, 5)
+DPI = 100
+
+# figure of current process, it is created once and reused for every plot
+_figure = None
+
+def _get_axes():
+    global _figure
+    if _figure is None:
+        _figure = Figure(figsize=FIGSIZE, dpi=DPI)
+        FigureCanvasAgg(_figure)
+        _figure.add_subplot(111)
+    return _figure.axes[0]
+
+def _annotate(subplot, function, xlim):
+    '''
+    Mark critical points and shade ascending (green) and descending (red) intervals
+    '''
+    if function.get_power() > 0:
+        asc, desc = function.get_intervals()
+        for intervals, color in ((asc, "tab:green"), (desc, "tab:red")):
+            for l, r in intervals:
+                l, r = max(l, xlim[0]), min(r, xlim[1])
+                if l < r:
+                    subplot.axvspan(l, r, color=color, alpha=0.15, linewidth=0)
+
+    for x in function.get_derivative().get_zero_points():
+        if xlim[0] <= x <= xlim[1]:
+            y = function.get_at_point(x)
+            subplot.plot([x], [y], "o", color="tab:blue")
+            subplot.annotate(f"({x:.3f}, {y:.3f})", (x, y), textcoords="offset points", xytext=(5, 5))
+
+def render(function, xlim, path, annotate=True):
+    '''
+    Draw graph of function on xlim and save it to path, format is chosen by extension
+    function - Polynomial or text for parser
+    Return path, or None if text is wrong input
+    '''
+    if isinstance(function, str):
+        function = parser(function)
+    if function == None:
+        return None
+
+    subplot = _get_axes()
+    subplot.cla()
+    subplot.set_xlabel("X")
+    subplot.set_ylabel("Y")
+    subplot.set_title(function.to_str())
+
+    X, Y = adaptive_samples(function, xlim, subplot.bbox.width, subplot.bbox.height)
+    subplot.plot(X, Y, color="black", linewidth=2)
+    if annotate:
+        _annotate(subplot, function, xlim)
+    subplot.set_xlim(xlim)
+    subplot.set_ylim(fit_ylim(Y))
+
+    subplot.figure.savefig(path)
+    return path
+
+def render_many(functions, xlim, paths, workers=None, annotate=True, chunksize=16) -> list:
+    '''
+    Render every function to corresponding path by pool of processes
+    Every process reuses one figure for all its plots
+    Return list of results of render in the same order
+    '''
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(render, functions, repeat(xlim), paths, repeat(annotate), chunksize=chunksize))